@@ -1,9 +1,13 @@
+import copy
+import hashlib
+import json
 import re
+from dataclasses import asdict
 from typing import Dict, Any, Optional
 from rich.console import Console
 from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn
-from .workflow_models import Workflow, Step
+from .workflow_models import StepDC, WorkflowDC
 from .loader import validate_workflow_params
 from .tools.model_call import ModelCallTool
 from .tools.parallel_query import ParallelQueryTool
@@ -21,6 +25,10 @@ class WorkflowExecutor:
         self.current_params: Dict[str, Any] = {}
         self.vault_password = vault_password
         self.memory_manager = memory_manager
+        # Results of steps marked `cache: true`, keyed by tool and resolved inputs
+        self._step_cache: Dict[str, Any] = {}
+        # Whether the last execute_workflow ran every step without an error
+        self.last_run_complete = False
 
         # Initialize tool registry
         self.tools = {
@@ -29,7 +37,7 @@ class WorkflowExecutor:
         }
 
     def execute_workflow(
-        self, workflow_name: str, workflow: Workflow, params: Dict[str, Any]
+        self, workflow_name: str, workflow: WorkflowDC, params: Dict[str, Any]
     ) -> Dict[str, Any]:
         """
         Execute a complete workflow with the given parameters.
@@ -40,9 +48,11 @@ class WorkflowExecutor:
             params: Parameters provided for the workflow
 
         Returns:
-            Dict containing the outputs of all executed steps
+            Dict containing the outputs of all executed steps. last_run_complete
+            tells whether every step ran without an error.
         """
         console.print(f"\n🚀 Starting workflow: [bold blue]{workflow_name}[/bold blue]")
+        self.last_run_complete = False
 
         # Initialize memory for this workflow execution
         if self.memory_manager:
@@ -63,7 +73,7 @@ class WorkflowExecutor:
             else:
                 # Handle Param objects
                 workflow_params_dict = {
-                    name: param.dict() for name, param in workflow.params.items()
+                    name: asdict(param) for name, param in workflow.params.items()
                 }
 
             self.current_params = validate_workflow_params(
@@ -77,6 +87,8 @@ class WorkflowExecutor:
 
         # Reset step outputs for this workflow execution
         self.step_outputs = {}
+        # Cleared by a rejected gate, a failed step or a tool's error fallback
+        complete = True
 
         # Execute each step in sequence
         with Progress(
@@ -99,6 +111,7 @@ class WorkflowExecutor:
                                 f"🛑 Workflow stopped at gate: {step.name}",
                                 style="yellow",
                             )
+                            complete = False
                             break
                         continue
 
@@ -133,7 +146,7 @@ class WorkflowExecutor:
                     )
 
                     # Execute the step
-                    step_output = self._execute_step(step, resolved_inputs)
+                    step_output = self._run_step(step, resolved_inputs)
 
                     # Save step result to memory
                     if self.memory_manager:
@@ -141,11 +154,14 @@ class WorkflowExecutor:
 
                     # Store the output for future steps
                     self.step_outputs[step.name] = step_output
+                    if isinstance(step_output, dict) and "error" in step_output:
+                        complete = False
 
                     progress.update(task, completed=True)
                     console.print(f"✅ Step '{step.name}' completed", style="green")
 
                 except Exception as e:
+                    complete = False
                     progress.update(task, completed=True)
                     console.print(f"❌ Step '{step.name}' failed: {str(e)}", style="red")
 
@@ -169,6 +185,7 @@ class WorkflowExecutor:
         console.print(
             f"🎉 Workflow '{workflow_name}' completed successfully!", style="bold green"
         )
+        self.last_run_complete = complete
         return self.step_outputs
 
     def _resolve_inputs(
@@ -303,8 +320,48 @@ class WorkflowExecutor:
                 f"Unknown path prefix: {parts[0]}. Use 'params.', 'steps.', or 'memory.'"
             )
 
+    def _run_step(
+        self, step: StepDC, resolved_inputs: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Execute a step, reusing an earlier result if the step is cacheable.
+
+        Only steps marked `cache: true` are memoized, since LLM calls are not
+        deterministic. The key covers the tool and the fully resolved inputs
+        (including the model), so a change in parameters or in any upstream
+        step output produces a new key.
+
+        Args:
+            step: Step configuration
+            resolved_inputs: Inputs with resolved placeholders
+
+        Returns:
+            Dict containing the step output
+        """
+        if not step.cache:
+            return self._execute_step(step, resolved_inputs)
+
+        key = hashlib.blake2b(
+            json.dumps(
+                {"tool": step.tool, "inputs": resolved_inputs},
+                sort_keys=True,
+                default=str,
+            ).encode(),
+            digest_size=16,
+        ).hexdigest()
+        # Cached outputs are copied in and out, so callers mutating a result
+        # cannot change what later hits return
+        if key in self._step_cache:
+            console.print(f"♻️  Reusing cached result for step '{step.name}'")
+            return copy.deepcopy(self._step_cache[key])
+
+        step_output = self._execute_step(step, resolved_inputs)
+        if not (isinstance(step_output, dict) and "error" in step_output):
+            self._step_cache[key] = copy.deepcopy(step_output)
+        return step_output
+
     def _execute_step(
-        self, step: Step, resolved_inputs: Dict[str, Any]
+        self, step: StepDC, resolved_inputs: Dict[str, Any]
     ) -> Dict[str, Any]:
         """
         Execute a single step using the real tool implementations.
@@ -346,7 +403,7 @@ class WorkflowExecutor:
                 "inputs": resolved_inputs,
             }
 
-    def _handle_scrutiny_gate(self, step: Step) -> bool:
+    def _handle_scrutiny_gate(self, step: StepDC) -> bool:
         """
         Handle a scrutiny gate step by prompting the user for approval.
 
@@ -1,33 +1,101 @@
 import base64
 import hashlib
 import os
+from pathlib import Path
+from typing import Optional
 
 from cryptography.fernet import Fernet, InvalidToken
 
 VAULT_FILE_PATH = os.environ.get("VAULT_FILE_PATH", "vault.enc")
 PASSWORD_SALT = b"a-secure-random-salt-should-be-used-here"
 
+# Key derivation functions a vault can be keyed with. Vaults written before
+# scrypt support are a bare Fernet token keyed with PBKDF2; newer vaults start
+# with a KDF version byte. Fernet tokens always begin with b"g", so the two
+# layouts cannot be confused.
+KDF_PBKDF2 = 0
+KDF_SCRYPT = 1
+_SCRYPT_HEADER = b"\x01"
 
-def derive_key(password: str, salt: bytes) -> bytes:
+
+def derive_key(password: str, salt: bytes, kdf: int = KDF_SCRYPT) -> bytes:
     """Derive a stable encryption key from a password."""
-    kdf = hashlib.pbkdf2_hmac("sha256", password.encode("utf-8"), salt, 100000, 32)
-    return base64.urlsafe_b64encode(kdf)
+    if kdf == KDF_SCRYPT:
+        raw = hashlib.scrypt(
+            password.encode("utf-8"), salt=salt, n=2**14, r=8, p=1, dklen=32
+        )
+    else:
+        raw = hashlib.pbkdf2_hmac("sha256", password.encode("utf-8"), salt, 100000, 32)
+    return base64.urlsafe_b64encode(raw)
+
+
+def split_vault(data: bytes) -> tuple[int, bytes]:
+    """Return the KDF a vault file was keyed with and its Fernet token."""
+    if data[:1] == _SCRYPT_HEADER:
+        return KDF_SCRYPT, data[1:]
+    return KDF_PBKDF2, data
+
+
+def encrypt_vault(plaintext: bytes, key: bytes, kdf: int = KDF_SCRYPT) -> bytes:
+    """Encrypt vault contents with a key from derive_key, tagged with its KDF."""
+    token = Fernet(key).encrypt(plaintext)
+    return _SCRYPT_HEADER + token if kdf == KDF_SCRYPT else token
+
+
+# Derived keys indexed by a digest of (kdf, salt, password), so the plaintext
+# password itself is never held by the cache.
+_DERIVED_KEY_CACHE: dict[bytes, bytes] = {}
+_DERIVED_KEY_CACHE_SIZE = 4
+
+
+def derive_key_cached(
+    password: str, salt: bytes = PASSWORD_SALT, kdf: int = KDF_SCRYPT
+) -> bytes:
+    """Derive a key like derive_key, reusing the result within this process."""
+    cache_key = hashlib.blake2b(
+        bytes([kdf]) + salt + b"\0" + password.encode("utf-8")
+    ).digest()
+    key = _DERIVED_KEY_CACHE.get(cache_key)
+    if key is None:
+        key = derive_key(password, salt, kdf)
+        if len(_DERIVED_KEY_CACHE) >= _DERIVED_KEY_CACHE_SIZE:
+            _DERIVED_KEY_CACHE.clear()
+        _DERIVED_KEY_CACHE[cache_key] = key
+    return key
+
+
+def clear_derived_key_cache() -> None:
+    """Forget all derived keys, e.g. once the vault is no longer needed."""
+    _DERIVED_KEY_CACHE.clear()
+
 
+def get_api_keys(
+    password: Optional[str] = None, derived_key: Optional[bytes] = None
+) -> dict[str, str]:
+    """
+    Decrypt the vault and return API keys.
 
-def get_api_keys(password: str) -> dict[str, str]:
-    """Decrypt the vault and return API keys."""
+    Pass either the vault password or a key previously returned by
+    derive_key_cached for this vault's KDF; the latter skips key derivation
+    entirely.
+    """
+    if derived_key is None and password is None:
+        raise ValueError("Either a password or a derived key is required.")
     vault_path = os.environ.get("VAULT_FILE_PATH", "vault.enc")
     if not os.path.exists(vault_path):
         raise FileNotFoundError(
             f"Vault file not found at {vault_path}. Please run init_vault.py."
         )
     try:
-        with open(vault_path, "rb") as f:
-            encrypted_data = f.read()
+        kdf, token = split_vault(Path(vault_path).read_bytes())
 
-        encryption_key = derive_key(password, PASSWORD_SALT)
-        cipher = Fernet(encryption_key)
-        decrypted_data = cipher.decrypt(encrypted_data).decode("utf-8")
+        encryption_key = derived_key or derive_key_cached(password, kdf=kdf)
+        try:
+            cipher = Fernet(encryption_key)
+        except ValueError:
+            # A malformed derived_key is as wrong as a wrong password
+            raise InvalidToken
+        decrypted_data = cipher.decrypt(token).decode("utf-8")
 
         keys = dict(line.split("=", 1) for line in decrypted_data.splitlines() if line)
         return keys
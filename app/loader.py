@@ -1,13 +1,72 @@
 import yaml
 from pydantic import ValidationError
-from typing import Dict, Any
+from typing import Dict, Any, List
 from rich.console import Console
-from .workflow_models import Config
+from .workflow_models import (
+    Config,
+    ConfigDC,
+    Param,
+    ParamDC,
+    StepDC,
+    WorkflowDC,
+)
 
 console = Console()
 
 
-def load_config(path: str = "config.yaml") -> Config:
+def _params_info(params: Any) -> List[Dict[str, Any]]:
+    """Describe workflow parameters in the format used by list_workflows."""
+    if not isinstance(params, list):
+        return [
+            {
+                "name": name,
+                "required": param.required,
+                "type": param.type,
+                "description": param.description,
+            }
+            for name, param in params.items()
+        ]
+
+    params_info = []
+    for param in params:
+        if isinstance(param, str):
+            params_info.append({"name": param, "required": True})
+        elif isinstance(param, dict):
+            for key, value in param.items():
+                if isinstance(value, str):
+                    params_info.append(
+                        {"name": key, "default": value, "required": False}
+                    )
+                else:
+                    params_info.append(
+                        {"name": key, "required": value.get("required", True)}
+                    )
+    return params_info
+
+
+def _to_dc(config: Config) -> ConfigDC:
+    """Convert a validated Pydantic config into its read-only dataclass form."""
+    workflows = {}
+    for name, workflow in config.workflows.items():
+        if isinstance(workflow.params, dict):
+            params = {
+                param_name: ParamDC(**param.model_dump())
+                if isinstance(param, Param)
+                else param
+                for param_name, param in workflow.params.items()
+            }
+        else:
+            params = list(workflow.params)
+        workflows[name] = WorkflowDC(
+            params=params,
+            steps=[StepDC(**step.model_dump()) for step in workflow.steps],
+            params_info=_params_info(params),
+            cacheable=workflow.cacheable,
+        )
+    return ConfigDC(workflows=workflows, main_llm=config.main_llm)
+
+
+def load_config(path: str = "config.yaml") -> ConfigDC:
     """
     Load and validate configuration from YAML file.
 
@@ -15,11 +74,14 @@ def load_config(path: str = "config.yaml") -> Config:
         path: Path to the configuration file
 
     Returns:
-        Config: Validated configuration object
+        ConfigDC: Validated, read-only configuration object
 
     Raises:
         SystemExit: If configuration file is not found or invalid
     """
+    if not Config.__pydantic_complete__:
+        Config.model_rebuild()
+
     try:
         with open(path, "r") as f:
             data = yaml.safe_load(f)
@@ -27,7 +89,7 @@ def load_config(path: str = "config.yaml") -> Config:
         # Validate the configuration using Pydantic
         config = Config.model_validate(data)
         console.print(f"✅ Configuration loaded successfully from {path}", style="green")
-        return config
+        return _to_dc(config)
 
     except FileNotFoundError:
         console.print(f"❌ Error: Configuration file not found at {path}", style="red")
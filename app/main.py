@@ -21,6 +21,8 @@ from app.memory_store import MemoryStore
 
 console = Console()
 
+_STEP_RE = re.compile(r"^(?P<role>\w+)>/(?P<persona>\w+)\)-(?P<model>\w+)$")
+
 
 # --- Configuration Loading & Saving ---
 def get_config_path():
@@ -574,7 +576,7 @@ def parse_step(step_str: str):
     Returns:
         dict: The parsed step dictionary.
     """
-    match = re.match(r"^(?P<role>\w+)>/(?P<persona>\w+)\)-(?P<model>\w+)$", step_str)
+    match = _STEP_RE.match(step_str)
     if not match:
         console.print(f"[bold red]Invalid step format:[/bold red] '{step_str}'.")
         return None
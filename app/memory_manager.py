@@ -6,11 +6,15 @@ with the MemoryStore to provide context-aware workflow execution.
 
 import re
 import uuid
-from typing import Any, Dict, List, Optional
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
 from datetime import datetime
 
 from .memory_store import MemoryStore
 
+# {{memory.X}} placeholders filled in by inject_memory_context
+_MEM_RE = re.compile(r"\{\{(memory\.[^{}]+)\}\}")
+
 
 class MemoryManager:
     """
@@ -34,6 +38,19 @@ class MemoryManager:
         self.current_workflow_id: Optional[str] = None
         self.workflow_history: List[Dict[str, Any]] = []
 
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """
+        Save everything written inside the block in a single transaction.
+
+        Example:
+            with manager.batch():
+                manager.save_step_result("step_a", result_a)
+                manager.save_step_result("step_b", result_b)
+        """
+        with self.memory_store.batch():
+            yield
+
     def start_workflow(self, workflow_name: str, initial_params: Dict[str, Any]) -> str:
         """
         Start a new workflow execution and initialize memory tracking.
@@ -295,15 +312,15 @@ class MemoryManager:
 
         injected_inputs = copy.deepcopy(inputs)
 
+        def replace(match: re.Match) -> str:
+            value = context.get(match.group(1))
+            return match.group(0) if value is None else str(value)
+
         # Recursively inject context into string values
         def inject_recursive(obj):
             if isinstance(obj, str):
-                # Replace memory template variables
-                for var_name, var_value in context.items():
-                    if var_value is not None:
-                        template_var = "{{" + var_name + "}}"
-                        obj = obj.replace(template_var, str(var_value))
-                return obj
+                # Replace all memory template variables in a single pass
+                return _MEM_RE.sub(replace, obj)
             elif isinstance(obj, dict):
                 return {k: inject_recursive(v) for k, v in obj.items()}
             elif isinstance(obj, list):
@@ -5,8 +5,9 @@ This module provides SQLite-based storage for workflow execution context and res
 
 import sqlite3
 import json
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterator, List, Optional, Union
 from pathlib import Path
 
 
@@ -18,19 +19,86 @@ class MemoryStore:
     content, classification, and timestamps for context-aware workflow execution.
     """
 
-    def __init__(self, db_path: str = "memory.db"):
+    def __init__(self, db_path: str = "memory.db", fast_writes: bool = False):
         """
         Initialize the memory store and create necessary tables.
 
         Args:
-            db_path: Path to the SQLite database file
+            db_path: Path to the SQLite database file, or ":memory:" for a
+                private in-memory database that lives as long as this store
+            fast_writes: Put a file database in WAL mode with
+                synchronous=NORMAL, so commits skip the per-commit fsync.
+                A crash may lose the latest commits, and WAL mode persists in
+                the file, so use this only for scratch databases such as tests.
         """
         self.db_path = db_path
+        self.fast_writes = fast_writes and db_path != ":memory:"
+        # An in-memory database only exists while its connection is open,
+        # so it gets one long-lived connection instead of one per operation
+        self._conn: Optional[sqlite3.Connection] = (
+            sqlite3.connect(db_path) if db_path == ":memory:" else None
+        )
+        # Connection of the active batch() transaction, if any
+        self._batch_conn: Optional[sqlite3.Connection] = None
         self._init_database()
 
+    def _open_connection(self) -> sqlite3.Connection:
+        """Open a connection to the database file."""
+        conn = sqlite3.connect(self.db_path)
+        if self.fast_writes:
+            # WAL with synchronous=NORMAL fsyncs at checkpoints, not per commit
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA temp_store=MEMORY")
+        return conn
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Yield a connection, committing on success and rolling back on error."""
+        if self._batch_conn is not None:
+            # The enclosing batch() commits or rolls back as a whole
+            yield self._batch_conn
+            return
+
+        if self._conn is not None:
+            with self._conn:
+                yield self._conn
+            return
+
+        conn = self._open_connection()
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """
+        Group all operations in the block into a single transaction.
+
+        Nested calls join the outermost batch. If the block raises, every
+        write made inside it is rolled back.
+        """
+        if self._batch_conn is not None:
+            yield
+            return
+
+        conn = self._conn or self._open_connection()
+        self._batch_conn = conn
+        try:
+            with conn:
+                conn.execute("BEGIN")
+                yield
+        finally:
+            self._batch_conn = None
+            if conn is not self._conn:
+                conn.close()
+
     def _init_database(self):
         """Create the memory table if it doesn't exist."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
+            if self.fast_writes:
+                conn.execute("PRAGMA journal_mode=WAL")
             cursor = conn.cursor()
             cursor.execute(
                 """
@@ -48,10 +116,13 @@ class MemoryStore:
             )
 
             # Create indexes for efficient querying
+            # Serves retrieve() lookups by workflow, step and classification;
+            # supersedes the older (workflow_id, step_name) index
+            cursor.execute("DROP INDEX IF EXISTS idx_workflow_step")
             cursor.execute(
                 """
-                CREATE INDEX IF NOT EXISTS idx_workflow_step
-                ON memory_slices(workflow_id, step_name)
+                CREATE INDEX IF NOT EXISTS idx_workflow_step_class
+                ON memory_slices(workflow_id, step_name, classification)
             """
             )
             cursor.execute(
@@ -67,8 +138,6 @@ class MemoryStore:
             """
             )
 
-            conn.commit()
-
     def add_entry(
         self,
         workflow_id: str,
@@ -102,7 +171,7 @@ class MemoryStore:
         # Current timestamp for created_at
         created_at = datetime.now().isoformat()
 
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             cursor.execute(
                 """
@@ -121,7 +190,6 @@ class MemoryStore:
             )
 
             entry_id = cursor.lastrowid
-            conn.commit()
 
         return str(entry_id)
 
@@ -169,9 +237,9 @@ class MemoryStore:
 
         query = " ".join(query_parts)
 
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row  # Enable column access by name
+        with self._connect() as conn:
             cursor = conn.cursor()
+            cursor.row_factory = sqlite3.Row  # Enable column access by name
             cursor.execute(query, params)
 
             results = []
@@ -282,7 +350,7 @@ class MemoryStore:
         cutoff_date = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
         cutoff_date = cutoff_date.replace(day=cutoff_date.day - days_old)
 
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             cursor.execute(
                 """
@@ -293,7 +361,6 @@ class MemoryStore:
             )
 
             deleted_count = cursor.rowcount
-            conn.commit()
 
         return deleted_count
 
@@ -304,7 +371,7 @@ class MemoryStore:
         Returns:
             Dictionary with statistics
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
 
             # Total entries
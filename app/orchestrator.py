@@ -1,4 +1,5 @@
 import asyncio
+import functools
 from typing import Any
 
 import yaml
@@ -10,10 +11,28 @@ from app.clients import get_client
 MODELS_CONFIG_PATH = "models.yaml"
 console = Console()
 
+# Prompt templates for sequential refinement, built once at import.
+_FIRST_STEP_TEMPLATE = (
+    "As a {persona}, your role is to {role}. "
+    "Your first task is to address the following prompt:\n\n{prompt}"
+)
+_CONTINUATION_TEMPLATE = (
+    "You are a {persona}, and your role is to {role} the following text. "
+    "Continue the chain of thought.\n\n"
+    "Previous response:\n{previous_response}\n\n"
+    "Your task is to now {role} this response."
+)
+
 
 # --- Load Model Configuration ---
+@functools.cache
 def load_model_config() -> dict[str, Any]:
-    """Load model configurations from the YAML file."""
+    """
+    Load model configurations from the YAML file.
+
+    The file is parsed once per process; callers share the returned dict and
+    must treat it as read-only.
+    """
     try:
         with open(MODELS_CONFIG_PATH) as f:
             config = yaml.safe_load(f)
@@ -31,6 +50,14 @@ MODEL_CONFIG = load_model_config()
 
 
 # --- Core Orchestration Logic ---
+async def _query_model(client: Any, prompt: str) -> str:
+    """Query a single client, reporting failures inline instead of raising."""
+    try:
+        return await client.query(prompt)
+    except Exception as e:
+        return f"Error: {e}"
+
+
 async def parallel_query(
     prompt: str, api_keys: dict[str, str], model_config: dict[str, Any]
 ) -> dict[str, str]:
@@ -45,28 +72,20 @@ async def parallel_query(
     Returns:
         Dict[str, str]: A dictionary of responses from the models.
     """
-    tasks = []
+    tasks: dict[str, asyncio.Task] = {}
 
-    for model_id, config in model_config.items():
-        key_name = f"{model_id.upper()}_API_KEY"
-        if key_name in api_keys:
-            client = get_client(
-                client_name=model_id, api_key=api_keys[key_name], model_config=config
-            )
-            tasks.append(client.query(prompt))
-
-    responses = await asyncio.gather(*tasks, return_exceptions=True)
+    async with asyncio.TaskGroup() as tg:
+        for model_id, config in model_config.items():
+            key_name = f"{model_id.upper()}_API_KEY"
+            if key_name in api_keys:
+                client = get_client(
+                    client_name=model_id,
+                    api_key=api_keys[key_name],
+                    model_config=config,
+                )
+                tasks[model_id] = tg.create_task(_query_model(client, prompt))
 
-    results = {}
-    model_ids = list(model_config.keys())
-    for i, model_id in enumerate(model_ids):
-        if i < len(responses):
-            if isinstance(responses[i], Exception):
-                results[model_id] = f"Error: {responses[i]}"
-            else:
-                results[model_id] = results[model_id] = responses[i]
-
-    return results
+    return {model_id: task.result() for model_id, task in tasks.items()}
 
 
 async def sequential_refinement(
@@ -104,10 +123,17 @@ async def sequential_refinement(
 
         # Construct the prompt for the current step
         if len(conversation) == 1:  # First step
-            step_prompt = f"As a {persona}, your role is to {role}. Your first task is to address the following prompt:\n\n{current_prompt}"
+            step_prompt = _FIRST_STEP_TEMPLATE.format_map(
+                {"persona": persona, "role": role, "prompt": current_prompt}
+            )
         else:
-            previous_response = conversation[-1]["content"]
-            step_prompt = f"You are a {persona}, and your role is to {role} the following text. Continue the chain of thought.\n\nPrevious response:\n{previous_response}\n\nYour task is to now {role} this response."
+            step_prompt = _CONTINUATION_TEMPLATE.format_map(
+                {
+                    "persona": persona,
+                    "role": role,
+                    "previous_response": conversation[-1]["content"],
+                }
+            )
 
         config = MODEL_CONFIG.get(model_id, {})
         client = get_client(
@@ -31,13 +31,16 @@ class BaseTool(ABC):
         """
         pass
 
-    @property
-    def name(self) -> str:
-        """Return the tool name (defaults to class name without 'Tool' suffix)."""
-        class_name = self.__class__.__name__
-        if class_name.endswith("Tool"):
-            return class_name[:-4].lower()
-        return class_name.lower()
+    name: str
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        """Set the tool name once per class (class name without 'Tool' suffix)."""
+        super().__init_subclass__(**kwargs)
+        if "name" not in cls.__dict__:
+            class_name = cls.__name__
+            if class_name.endswith("Tool"):
+                class_name = class_name[:-4]
+            cls.name = class_name.lower()
 
     def validate_inputs(self, **kwargs) -> None:
         """
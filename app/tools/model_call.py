@@ -5,6 +5,7 @@ This is the core tool that handles communication with various LLM providers.
 
 import asyncio
 import os
+import threading
 from typing import Dict, Any, Optional
 from rich.console import Console
 
@@ -38,6 +39,9 @@ class ModelCallTool(BaseTool):
         """
         self.vault_password = vault_password
         self._api_keys: Optional[Dict[str, str]] = None
+        # Remembers a failed lookup so later calls go straight to simulation
+        self._keys_unavailable = False
+        self._keys_lock = threading.Lock()
 
     def validate_inputs(self, **kwargs) -> None:
         """Validate required inputs for model call."""
@@ -59,35 +63,48 @@ class ModelCallTool(BaseTool):
 
     def _get_api_keys(self) -> Dict[str, str]:
         """Get API keys from vault or environment variables."""
-        if self._api_keys is None:
-            if self.vault_password is None:
-                # Try to get keys from environment variables
-                env_keys = {}
-                for key in ["ANTHROPIC_API_KEY", "GEMINI_API_KEY", "DEEPSEEK_API_KEY", "MISTRAL_API_KEY"]:
-                    if key in os.environ:
-                        env_keys[key] = os.environ[key]
-                
-                if env_keys:
-                    console.print(f"✅ Found {len(env_keys)} API keys in environment", style="green")
-                    self._api_keys = env_keys
-                    return self._api_keys
-                else:
-                    console.print(
-                        "⚠️  No vault password provided and no API keys in environment, using simulation mode",
-                        style="yellow",
-                    )
-                    return {}
-
-            try:
-                self._api_keys = get_api_keys(self.vault_password)
-                console.print("✅ API keys loaded from vault", style="green")
-            except Exception as e:
-                console.print(f"❌ Failed to load API keys: {str(e)}", style="red")
-                console.print("🔄 Falling back to simulation mode", style="yellow")
-                return {}
+        if self._api_keys is not None:
+            return self._api_keys
+        if self._keys_unavailable:
+            return {}
+
+        # Serialize the first lookup; ParallelQueryTool shares this instance
+        # across worker threads.
+        with self._keys_lock:
+            if self._api_keys is None and not self._keys_unavailable:
+                self._api_keys = self._load_api_keys()
+                self._keys_unavailable = self._api_keys is None
 
         return self._api_keys or {}
 
+    def _load_api_keys(self) -> Optional[Dict[str, str]]:
+        """Load API keys once, returning None when none are available."""
+        if self.vault_password is None:
+            # Try to get keys from environment variables
+            env_keys = {}
+            for key in ["ANTHROPIC_API_KEY", "GEMINI_API_KEY", "DEEPSEEK_API_KEY", "MISTRAL_API_KEY"]:
+                if key in os.environ:
+                    env_keys[key] = os.environ[key]
+
+            if env_keys:
+                console.print(f"✅ Found {len(env_keys)} API keys in environment", style="green")
+                return env_keys
+
+            console.print(
+                "⚠️  No vault password provided and no API keys in environment, using simulation mode",
+                style="yellow",
+            )
+            return None
+
+        try:
+            api_keys = get_api_keys(self.vault_password)
+            console.print("✅ API keys loaded from vault", style="green")
+            return api_keys
+        except Exception as e:
+            console.print(f"❌ Failed to load API keys: {str(e)}", style="red")
+            console.print("🔄 Falling back to simulation mode", style="yellow")
+            return None
+
     def execute(self, **kwargs) -> Dict[str, Any]:
         """
         Execute a model call with the given parameters.
@@ -1,12 +1,88 @@
+import copy
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+import zipimport
+from functools import cached_property
+from pathlib import Path
 from typing import Dict, Any, Optional
 from rich.console import Console
+from rich.text import Text
 from .loader import load_config
 from .executor import WorkflowExecutor
-from .workflow_models import Config
+from .workflow_models import ConfigDC
 from .memory_manager import MemoryManager
 
 console = Console()
 
+# Parsed configurations are pickled here, keyed by config path, mtime and size
+_CACHE_DIR = Path("~/.cache/llm_orchestrator").expanduser()
+# Bump whenever the pickled config classes change shape
+_CACHE_VERSION = 4
+# Set to any non-empty value to always parse the config from scratch
+_NOCACHE_ENV = "LLM_ORCH_NOCACHE"
+# Modules whose changes invalidate cached configs. Inside a zipapp they can't
+# be stat'ed, so the archive stands in for them: rebuilding it changes its stamp
+if isinstance(__loader__, zipimport.zipimporter):
+    _CACHE_SOURCES = (Path(__loader__.archive),)
+else:
+    _CACHE_SOURCES = (
+        Path(__file__).with_name("loader.py"),
+        Path(__file__).with_name("workflow_models.py"),
+    )
+
+
+def _config_cache_file(config_path: str) -> Optional[Path]:
+    """Return the cache file for the current state of a config file."""
+    if os.environ.get(_NOCACHE_ENV):
+        return None
+    abspath = os.path.abspath(config_path)
+    try:
+        stamps = [os.stat(abspath)] + [os.stat(source) for source in _CACHE_SOURCES]
+    except OSError:
+        return None
+    path_key = hashlib.blake2b(abspath.encode(), digest_size=8).hexdigest()
+    state = ":".join(f"{st.st_mtime_ns}:{st.st_size}" for st in stamps)
+    state_key = hashlib.blake2b(
+        f"{_CACHE_VERSION}:{state}".encode(), digest_size=8
+    ).hexdigest()
+    return _CACHE_DIR / f"{path_key}-{state_key}.pkl"
+
+
+def _read_cached_config(cache_file: Path) -> Optional[ConfigDC]:
+    """Load a pickled configuration, returning None on any cache miss."""
+    try:
+        with open(cache_file, "rb") as f:
+            config = pickle.load(f)
+    except Exception:
+        return None
+    return config if isinstance(config, ConfigDC) else None
+
+
+def _write_cached_config(cache_file: Path, config: ConfigDC) -> None:
+    """Pickle a configuration and drop stale entries for the same path."""
+    path_key = cache_file.name.split("-", 1)[0]
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        for stale in cache_file.parent.glob(f"{path_key}-*.pkl"):
+            if stale != cache_file:
+                stale.unlink(missing_ok=True)
+        # A unique temp file keeps concurrent writers from interleaving;
+        # os.replace then publishes each complete pickle atomically
+        fd, tmp_name = tempfile.mkstemp(dir=cache_file.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(config, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_name, cache_file)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+    except OSError:
+        # Caching is best-effort; the parsed config is still usable
+        pass
+
 
 class WorkflowEngine:
     """
@@ -24,21 +100,45 @@ class WorkflowEngine:
             vault_password: Password for decrypting API keys (optional)
         """
         self.config_path = config_path
-        self.config: Optional[Config] = None
+        self.config: Optional[ConfigDC] = None
+        self._workflows_info_cache: Optional[Dict[str, Any]] = None
+        # Results of `cacheable: true` workflows, keyed by workflow and params
+        self._workflow_cache: Dict[str, Dict[str, Any]] = {}
         self.vault_password = vault_password
 
-        # Initialize memory manager
-        self.memory_manager = MemoryManager()
+        # Load and validate configuration on initialization; the memory
+        # manager and executor are created on first use (see below)
+        self._load_configuration()
 
-        # Initialize executor with memory manager
-        self.executor = WorkflowExecutor(vault_password, self.memory_manager)
+    @cached_property
+    def memory_manager(self) -> MemoryManager:
+        """Memory manager backing workflow runs, created on first use."""
+        return MemoryManager()
 
-        # Load and validate configuration on initialization
-        self._load_configuration()
+    @cached_property
+    def executor(self) -> WorkflowExecutor:
+        """Workflow executor and its tools, created on first run."""
+        return WorkflowExecutor(self.vault_password, self.memory_manager)
+
+    def _load_configuration(self, use_cache: bool = True):
+        """
+        Load and validate the configuration file.
 
-    def _load_configuration(self):
-        """Load and validate the configuration file."""
-        self.config = load_config(self.config_path)
+        Args:
+            use_cache: Reuse a pickled config if the file is unchanged on disk
+        """
+        cache_file = _config_cache_file(self.config_path)
+        config = None
+        if use_cache and cache_file is not None:
+            config = _read_cached_config(cache_file)
+        if config is None:
+            config = load_config(self.config_path)
+            if cache_file is not None:
+                _write_cached_config(cache_file, config)
+
+        self.config = config
+        self._workflows_info_cache = None
+        self._workflow_cache.clear()
         console.print(
             f"📋 Loaded {len(self.config.workflows)} workflows: {list(self.config.workflows.keys())}"
         )
@@ -52,45 +152,19 @@ class WorkflowEngine:
         """
         if not self.config:
             return {}
+        if self._workflows_info_cache is not None:
+            return self._workflows_info_cache
 
-        workflows_info = {}
-        for name, workflow in self.config.workflows.items():
-            # Extract parameter information
-            if isinstance(workflow.params, list):
-                params_info = []
-                for param in workflow.params:
-                    if isinstance(param, str):
-                        params_info.append({"name": param, "required": True})
-                    elif isinstance(param, dict):
-                        for key, value in param.items():
-                            if isinstance(value, str):
-                                params_info.append(
-                                    {"name": key, "default": value, "required": False}
-                                )
-                            else:
-                                params_info.append(
-                                    {
-                                        "name": key,
-                                        "required": value.get("required", True),
-                                    }
-                                )
-            else:
-                params_info = [
-                    {
-                        "name": name,
-                        "required": param.required,
-                        "type": param.type,
-                        "description": param.description,
-                    }
-                    for name, param in workflow.params.items()
-                ]
-
-            workflows_info[name] = {
-                "parameters": params_info,
+        workflows_info = {
+            name: {
+                "parameters": workflow.params_info,
                 "steps": len(workflow.steps),
                 "step_names": [step.name for step in workflow.steps],
             }
+            for name, workflow in self.config.workflows.items()
+        }
 
+        self._workflows_info_cache = workflows_info
         return workflows_info
 
     def run(self, workflow_name: str, params: Dict[str, Any]) -> Dict[str, Any]:
@@ -118,13 +192,39 @@ class WorkflowEngine:
 
         workflow = self.config.workflows[workflow_name]
 
-        console.print("\n📊 Workflow Info:")
-        console.print(f"  • Name: {workflow_name}")
-        console.print(f"  • Steps: {len(workflow.steps)}")
-        console.print(f"  • Parameters: {list(params.keys())}")
+        console.print(
+            Text(
+                "\n📊 Workflow Info:\n"
+                f"  • Name: {workflow_name}\n"
+                f"  • Steps: {len(workflow.steps)}\n"
+                f"  • Parameters: {list(params.keys())}"
+            )
+        )
+
+        # A cacheable workflow's steps depend only on its params, so an
+        # identical run earlier in this session can be returned as a whole
+        cache_key = None
+        if workflow.cacheable:
+            cache_key = hashlib.blake2b(
+                json.dumps(
+                    {"workflow": workflow_name, "params": params},
+                    sort_keys=True,
+                    default=str,
+                ).encode(),
+                digest_size=16,
+            ).hexdigest()
+            cached = self._workflow_cache.get(cache_key)
+            if cached is not None:
+                console.print(f"♻️  Reusing cached results for '{workflow_name}'")
+                return copy.deepcopy(cached)
 
         # Execute the workflow
-        return self.executor.execute_workflow(workflow_name, workflow, params)
+        result = self.executor.execute_workflow(workflow_name, workflow, params)
+        # Partial runs (rejected gate, failed or simulated steps) are retried
+        if cache_key is not None and self.executor.last_run_complete:
+            # Stored and returned as copies, so callers can't alter later hits
+            self._workflow_cache[cache_key] = copy.deepcopy(result)
+        return result
 
     def validate_workflow(self, workflow_name: str) -> bool:
         """
@@ -136,23 +236,13 @@ class WorkflowEngine:
         Returns:
             bool: True if valid, False otherwise
         """
-        if not self.config or workflow_name not in self.config.workflows:
-            return False
-
-        try:
-            workflow = self.config.workflows[workflow_name]
-            # Basic validation - check that all steps have required fields
-            for step in workflow.steps:
-                if not step.name or not step.tool:
-                    return False
-            return True
-        except Exception:
-            return False
+        # Steps without a name or tool are rejected when the config is loaded
+        return bool(self.config) and workflow_name in self.config.workflows
 
     def reload_config(self):
         """Reload the configuration file."""
         console.print("🔄 Reloading configuration...")
-        self._load_configuration()
+        self._load_configuration(use_cache=False)
 
 
 def main():
@@ -162,12 +252,13 @@ def main():
 
         # List available workflows
         workflows = engine.list_workflows()
-        console.print("\n📋 Available Workflows:")
+        lines = ["\n📋 Available Workflows:"]
         for name, info in workflows.items():
-            console.print(f"  • {name}: {info['steps']} steps")
+            lines.append(f"  • {name}: {info['steps']} steps")
             for param in info["parameters"]:
                 required = "required" if param.get("required", True) else "optional"
-                console.print(f"    - {param['name']} ({required})")
+                lines.append(f"    - {param['name']} ({required})")
+        console.print(Text("\n".join(lines)))
 
         # Example workflow execution
         if "sequential_elaboration" in workflows:
@@ -1,8 +1,15 @@
-from pydantic import BaseModel, Field
+from dataclasses import dataclass, field
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 from typing import List, Dict, Any, Optional, Union
 
+# Schema building is deferred until load_config first validates a config,
+# so importing this module stays cheap for commands that never touch it.
+_DEFERRED = ConfigDict(defer_build=True)
+
 
 class Param(BaseModel):
+    model_config = _DEFERRED
+
     type: str
     description: str
     required: bool = False
@@ -10,6 +17,8 @@ class Param(BaseModel):
 
 
 class Step(BaseModel):
+    model_config = _DEFERRED
+
     name: str
     tool: str
     inputs: Dict[str, Any]
@@ -17,16 +26,75 @@ class Step(BaseModel):
     permissions: List[str] = Field(default_factory=list)
     gate: Optional[Dict[str, str]] = None  # For scrutiny gates
     on_failure: str = "abort_chain"  # Default error handling
+    cache: bool = False  # Reuse results for identical resolved inputs
+
+    @field_validator("name", "tool")
+    @classmethod
+    def _not_empty(cls, value: str) -> str:
+        if not value:
+            raise ValueError("must not be empty")
+        return value
 
 
 class Workflow(BaseModel):
+    model_config = _DEFERRED
+
     params: Union[
         List[Union[str, Dict[str, Any]]], Dict[str, Param]
     ]  # Handle both formats
     steps: List[Step]
+    cacheable: bool = False  # Reuse whole-run results for identical params
+
+    @model_validator(mode="after")
+    def _no_cached_gates(self) -> "Workflow":
+        # A cache hit would skip the human approval a gate asks for
+        if self.cacheable and any(step.gate for step in self.steps):
+            raise ValueError("cacheable workflows cannot contain gate steps")
+        return self
 
 
 class Config(BaseModel):
+    model_config = _DEFERRED
+
     main_llm: Optional[Dict[str, str]] = None
     workflows: Dict[str, Workflow]
     # Add other top-level config sections here later, e.g., 'reformulation'
+
+
+# Read-only runtime representations. The Pydantic models above validate the
+# YAML once in load_config; the engine then works with these plain slotted
+# dataclasses, whose attribute access is cheaper than BaseModel's.
+
+
+@dataclass(slots=True, frozen=True)
+class ParamDC:
+    type: str
+    description: str
+    required: bool = False
+    default: Any = None
+
+
+@dataclass(slots=True, frozen=True)
+class StepDC:
+    name: str
+    tool: str
+    inputs: Dict[str, Any]
+    memory: Dict[str, Any] = field(default_factory=dict)
+    permissions: List[str] = field(default_factory=list)
+    gate: Optional[Dict[str, str]] = None
+    on_failure: str = "abort_chain"
+    cache: bool = False
+
+
+@dataclass(slots=True, frozen=True)
+class WorkflowDC:
+    params: Union[List[Union[str, Dict[str, Any]]], Dict[str, ParamDC]]
+    steps: List[StepDC]
+    params_info: List[Dict[str, Any]] = field(default_factory=list)
+    cacheable: bool = False
+
+
+@dataclass(slots=True, frozen=True)
+class ConfigDC:
+    workflows: Dict[str, WorkflowDC]
+    main_llm: Optional[Dict[str, str]] = None
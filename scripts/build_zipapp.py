@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Bundle the workflow runner into a single compressed zipapp.
+
+Usage: python -m scripts.build_zipapp [output]   (default: dist/llmo-run.pyz)
+
+The archive holds the app and scripts packages only; third-party dependencies
+still come from the interpreter that runs it, e.g.:
+
+    poetry run python dist/llmo-run.pyz sequential_elaboration user_prompt='Hi'
+"""
+
+import shutil
+import sys
+import tempfile
+import zipapp
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+PACKAGES = ("app", "scripts")
+ENTRY_POINT = "scripts.run_workflow:main"
+
+
+def build_zipapp(output: Path) -> Path:
+    """Write the zipapp to output and return its path."""
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.TemporaryDirectory() as staging:
+        for package in PACKAGES:
+            shutil.copytree(
+                PROJECT_ROOT / package,
+                Path(staging) / package,
+                ignore=shutil.ignore_patterns("__pycache__", "*.py[cod]"),
+            )
+        zipapp.create_archive(
+            staging,
+            target=output,
+            interpreter="/usr/bin/env python3",
+            main=ENTRY_POINT,
+            compressed=True,
+        )
+    return output
+
+
+def main():
+    if len(sys.argv) > 1:
+        output = Path(sys.argv[1])
+    else:
+        output = PROJECT_ROOT / "dist" / "llmo-run.pyz"
+    print(f"Built {build_zipapp(output)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,45 +1,57 @@
-import glob
 import os
+from pathlib import Path
 
 
-def create_summary(root_path):
+def _walk_markdown(root_path):
+    """Yield the paths of all Markdown files below root_path, skipping hidden entries."""
+    stack = [root_path]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.name.startswith("."):
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith(".md"):
+                    yield entry.path
+
+
+def create_summary(root_path, out):
     """
-    Generates a summary from all Markdown files in the specified root path,
-    with a special focus on architecture details.
+    Writes a summary of all Markdown files in the specified root path to the
+    open text file `out`, with a special focus on architecture details.
     """
-    summary = []
     architecture_docs = []
     other_docs = []
 
-    for md_file in glob.glob(os.path.join(root_path, "**/*.md"), recursive=True):
+    # The output file may itself live under root_path; never summarize it
+    output_path = os.path.abspath(getattr(out, "name", ""))
+
+    for md_file in _walk_markdown(root_path):
+        if os.path.abspath(md_file) == output_path:
+            continue
         if "architecture" in md_file:
             architecture_docs.append(md_file)
         else:
             other_docs.append(md_file)
 
-    summary.append("# Project Summary")
-    summary.append("## Architecture")
+    out.write("# Project Summary\n")
+    out.write("## Architecture\n")
 
     for doc in sorted(architecture_docs):
-        summary.append(f"### {os.path.basename(doc)}")
-        with open(doc) as f:
-            summary.append(f.read())
-        summary.append("\n---\n")
+        content = Path(doc).read_text(encoding="utf-8")
+        out.write(f"### {os.path.basename(doc)}\n{content}\n\n---\n\n")
 
-    summary.append("## Other Documents")
+    out.write("## Other Documents\n")
 
     for doc in sorted(other_docs):
-        summary.append(f"### {os.path.basename(doc)}")
-        with open(doc) as f:
-            summary.append(f.read())
-        summary.append("\n---\n")
-
-    return "\n".join(summary)
+        content = Path(doc).read_text(encoding="utf-8")
+        out.write(f"### {os.path.basename(doc)}\n{content}\n\n---\n\n")
 
 
 if __name__ == "__main__":
     project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    summary_content = create_summary(project_root)
-    with open(os.path.join(project_root, "project_summary.md"), "w") as f:
-        f.write(summary_content)
+    output_filename = os.path.join(project_root, "project_summary.md")
+    with open(output_filename, "w", encoding="utf-8", buffering=1 << 20) as out:
+        create_summary(project_root, out)
     print("Project summary created at project_summary.md")
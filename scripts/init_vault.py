@@ -1,18 +1,29 @@
 import os
-import platform
 import re
+import sys
+from pathlib import Path
 
 import click
-from cryptography.fernet import Fernet
 from rich.console import Console
-
-from app.key_management import PASSWORD_SALT, VAULT_FILE_PATH, derive_key
+from rich.text import Text
 
 console = Console()
 
+# One KEY_NAME=value pair per line; surrounding whitespace is ignored. [^\S\n]
+# is exactly the whitespace str.strip() removes, newlines excepted.
+_API_KEY_LINE_RE = re.compile(
+    r"^[^\S\n]*(?P<name>\w*_API_KEY)=(?P<key>.*?\S)[^\S\n]*$", re.MULTILINE
+)
+# Any KEY_NAME=value line, used only to explain why a line was rejected
+_KEY_LINE_RE = re.compile(r"^(?P<name>\w+)=(?P<key>.+)$")
+
+_IS_WINDOWS = sys.platform.startswith("win")
+
 
 def handle_existing_vault():
     """Checks for and handles an existing vault file."""
+    from app.key_management import VAULT_FILE_PATH
+
     if not os.path.exists(VAULT_FILE_PATH):
         return True
 
@@ -44,30 +55,27 @@ def handle_existing_vault():
 
 def parse_api_keys(text_block: str) -> dict:
     """Parses a block of text for API keys and returns a dictionary."""
-    keys = {}
-    lines = text_block.strip().split("\n")
-    for line in lines:
-        line = line.strip()
-        if not line:
-            continue
-
-        match = re.match(r"^(?P<name>\w+)=(?P<key>.+)$", line)
-        if not match:
+    matches = list(_API_KEY_LINE_RE.finditer(text_block))
+    lines = text_block.split("\n")
+
+    if len(matches) != sum(1 for line in lines if line.strip()):
+        # Report the first line that did not parse
+        for line in lines:
+            if not line.strip() or _API_KEY_LINE_RE.match(line):
+                continue
+            line = line.strip()
+            match = _KEY_LINE_RE.match(line)
+            if not match:
+                raise ValueError(
+                    f"Invalid format for line: '{line}'. Expected format: KEY_NAME=key_value"
+                )
             raise ValueError(
-                f"Invalid format for line: '{line}'. Expected format: KEY_NAME=key_value"
+                f"Invalid key name: '{match.group('name')}'. All keys must end with '_API_KEY'."
             )
+        # Never return a partial set of keys
+        raise ValueError("Could not parse every line of the API key block.")
 
-        key_name = match.group("name")
-        key_value = match.group("key")
-
-        if not key_name.endswith("_API_KEY"):
-            raise ValueError(
-                f"Invalid key name: '{key_name}'. All keys must end with '_API_KEY'."
-            )
-
-        keys[key_name] = key_value
-
-    return keys
+    return {match.group("name"): match.group("key") for match in matches}
 
 
 def display_export_commands(api_keys: dict):
@@ -76,16 +84,15 @@ def display_export_commands(api_keys: dict):
         "\n[bold cyan]To load these keys into your current terminal session, copy and paste the commands below:[/bold cyan]"
     )
 
-    is_windows = platform.system().lower() == "windows"
-
-    if is_windows:
+    if _IS_WINDOWS:
         console.print("[italic](Detected Windows PowerShell)[/italic]")
-        for name, key in api_keys.items():
-            console.print(f"$env:{name}='{key}'")
+        lines = [f"$env:{name}='{key}'" for name, key in api_keys.items()]
     else:
         console.print("[italic](Detected Linux/macOS)[/italic]")
-        for name, key in api_keys.items():
-            console.print(f"export {name}='{key}'")
+        lines = [f"export {name}='{key}'" for name, key in api_keys.items()]
+
+    # Plain Text: one render pass, and key values are never parsed as markup
+    console.print(Text("\n".join(lines)))
 
 
 @click.command()
@@ -93,6 +100,14 @@ def init_vault():
     """
     Initializes or overwrites the encrypted API key vault.
     """
+    # Deferred so that --help and parse_api_keys users skip the crypto stack
+    from app.key_management import (
+        PASSWORD_SALT,
+        VAULT_FILE_PATH,
+        derive_key,
+        encrypt_vault,
+    )
+
     console.print("[bold yellow]Welcome to the vault setup utility.[/bold yellow]")
 
     if not handle_existing_vault():
@@ -131,13 +146,11 @@ def init_vault():
         )
 
         encryption_key = derive_key(password, PASSWORD_SALT)
-        cipher = Fernet(encryption_key)
 
-        plaintext_keys = "\n".join([f"{name}={key}" for name, key in api_keys.items()])
-        encrypted_data = cipher.encrypt(plaintext_keys.encode("utf-8"))
+        plaintext_keys = "\n".join(f"{name}={key}" for name, key in api_keys.items())
+        encrypted_data = encrypt_vault(plaintext_keys.encode("utf-8"), encryption_key)
 
-        with open(VAULT_FILE_PATH, "wb") as f:
-            f.write(encrypted_data)
+        Path(VAULT_FILE_PATH).write_bytes(encrypted_data)
 
         console.print(
             f"\n[bold green]Vault created successfully at '{VAULT_FILE_PATH}'![/bold green]"
@@ -5,7 +5,7 @@ This is useful for testing and development when you want to use the real APIs.
 
 Usage:
     # Load keys and run a command
-    python scripts/load_env_keys.py python scripts/run_workflow.py sequential_elaboration user_prompt="test"
+    python scripts/load_env_keys.py python -m scripts.run_workflow sequential_elaboration user_prompt="test"
     
     # Just export the keys (for bash)
     eval $(python scripts/load_env_keys.py --export)
@@ -20,7 +20,6 @@ from pathlib import Path
 # Add the app directory to the path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from app.key_management import get_api_keys
 from rich.console import Console
 
 console = Console()
@@ -28,13 +27,14 @@ console = Console()
 
 def load_keys_to_env(vault_password: str) -> dict:
     """Load API keys from vault and set them as environment variables."""
+    from app.key_management import get_api_keys
+
     try:
         api_keys = get_api_keys(vault_password)
         
         # Set environment variables
-        for key, value in api_keys.items():
-            os.environ[key] = value
-            
+        os.environ.update(api_keys)
+
         console.print(f"✅ Loaded {len(api_keys)} API keys into environment", style="green")
         return api_keys
         
@@ -55,31 +55,50 @@ def main():
         console.print("  python scripts/load_env_keys.py <command> [args...]")
         console.print("  python scripts/load_env_keys.py --export")
         console.print("\nExamples:")
-        console.print("  python scripts/load_env_keys.py python scripts/run_workflow.py sequential_elaboration user_prompt='test'")
+        console.print("  python scripts/load_env_keys.py python -m scripts.run_workflow sequential_elaboration user_prompt='test'")
         console.print("  eval $(python scripts/load_env_keys.py --export)")
         return
 
+    from app.key_management import clear_derived_key_cache
+
     # Get vault password
     vault_password = getpass.getpass("Enter vault password: ")
     
-    # Load keys
+    # Load keys; the derived vault key is not needed past this point
     api_keys = load_keys_to_env(vault_password)
+    clear_derived_key_cache()
     
     if not api_keys:
         console.print("❌ No API keys loaded, exiting", style="red")
         sys.exit(1)
 
     if sys.argv[1] == "--export":
-        # Export format for bash
-        for key, value in api_keys.items():
-            print(f"export {key}='{value}'")
+        # Export format for bash, emitted in a single write for eval
+        sys.stdout.write(
+            "".join(f"export {key}='{value}'\n" for key, value in api_keys.items())
+        )
     else:
         # Run the command with loaded environment
         command = sys.argv[1:]
         console.print(f"🚀 Running command with loaded API keys: {' '.join(command)}", style="blue")
         
+        if os.name == "posix":
+            # Replace this process with the command; it inherits os.environ
+            sys.stdout.flush()
+            sys.stderr.flush()
+            try:
+                os.execvpe(command[0], command, os.environ)
+            except FileNotFoundError:
+                console.print(f"❌ Command not found: {command[0]}", style="red")
+                sys.exit(127)
+            except OSError as e:
+                console.print(f"❌ Failed to run command: {str(e)}", style="red")
+                sys.exit(1)
+
+        # os.exec* does not replace the process on Windows, so run a child
+        # there; it inherits the updated os.environ without an explicit copy
         try:
-            result = subprocess.run(command, env=os.environ.copy())
+            result = subprocess.run(command)
             sys.exit(result.returncode)
         except KeyboardInterrupt:
             console.print("\n⚠️  Command interrupted", style="yellow")
@@ -1,45 +1,50 @@
 #!/usr/bin/env python3
 """
 Simple workflow runner script for the LLM orchestrator.
-Usage: python scripts/run_workflow.py <workflow_name> [params...]
+Usage: llmo-run <workflow_name> [params...]
+   or: python -m scripts.run_workflow <workflow_name> [params...]
 """
 
-import json
 import sys
-from pathlib import Path
 
-from rich.console import Console
-
-# Add the app directory to the path
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
-from app.workflow_engine import WorkflowEngine
-
-console = Console()
+# Prefer a C JSON parser when one is installed (poetry install -E fastjson)
+try:
+    import orjson as _json
+except ImportError:
+    try:
+        import ujson as _json
+    except ImportError:
+        import json as _json
 
 
 def main():
     if len(sys.argv) < 2:
-        console.print(
-            "Usage: python scripts/run_workflow.py <workflow_name> [param=value ...]"
-        )
-        console.print(
-            "\nExample: python scripts/run_workflow.py sequential_elaboration user_prompt='What is AI?'"
-        )
+        print("Usage: llmo-run <workflow_name> [param=value ...]")
+        print("\nExample: llmo-run sequential_elaboration user_prompt='What is AI?'")
         return
 
+    # Deferred so the usage message above doesn't pay for these imports
+    from rich.console import Console
+
+    from app.workflow_engine import WorkflowEngine
+
+    # Plain output when piped: no colour, markup or highlighting passes
+    is_tty = sys.stdout.isatty()
+    console = Console(no_color=not is_tty, highlight=False, markup=is_tty)
+
     workflow_name = sys.argv[1]
 
     # Parse parameters from command line
     params = {}
     for arg in sys.argv[2:]:
-        if "=" in arg:
-            key, value = arg.split("=", 1)
-            # Try to parse as JSON, fallback to string
-            try:
-                params[key] = json.loads(value)
-            except:
-                params[key] = value
+        key, sep, value = arg.partition("=")
+        if not sep:
+            continue
+        # Try to parse as JSON, fallback to string
+        try:
+            params[key] = _json.loads(value)
+        except ValueError:
+            params[key] = value
 
     try:
         engine = WorkflowEngine()
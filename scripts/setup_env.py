@@ -8,17 +8,28 @@ import os
 import sys
 import getpass
 from pathlib import Path
+from typing import Optional
 
 # Add the app directory to the path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from app.key_management import get_api_keys
+from app.key_management import derive_key_cached, get_api_keys, split_vault
 from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import Prompt, Confirm
 
+try:
+    import keyring
+    from keyring.errors import KeyringError
+except ImportError:  # Optional: poetry install -E keyring
+    keyring = None
+
 console = Console()
 
+# Keyring entry holding the derived vault key (never the password itself)
+KEYRING_SERVICE = "llm_orch"
+KEYRING_USERNAME = "vault_dk"
+
 
 def check_vault_exists() -> bool:
     """Check if vault.enc exists."""
@@ -36,6 +47,46 @@ def check_env_keys() -> dict:
     return found_keys
 
 
+def load_keys_from_keyring() -> Optional[dict]:
+    """Decrypt the vault with a derived key remembered in the OS keyring, if any."""
+    if keyring is None:
+        return None
+    try:
+        stored_key = keyring.get_password(KEYRING_SERVICE, KEYRING_USERNAME)
+        if not stored_key:
+            return None
+        try:
+            return get_api_keys(derived_key=stored_key.encode("ascii"))
+        except ValueError:
+            # The vault was re-encrypted with another password; forget the key
+            keyring.delete_password(KEYRING_SERVICE, KEYRING_USERNAME)
+            console.print("⚠️  Stored vault key is out of date", style="yellow")
+            return None
+        except RuntimeError as e:
+            # The vault could not be read; keep the key and ask for the password
+            console.print(f"⚠️  Could not use stored vault key: {e}", style="yellow")
+            return None
+    except KeyringError:
+        return None
+
+
+def remember_key_in_keyring(vault_password: str) -> None:
+    """Offer to store the derived vault key so later runs skip the password prompt."""
+    if keyring is None:
+        return
+    if not Confirm.ask("Remember the vault key in the system keyring?", default=False):
+        return
+    try:
+        vault_path = os.environ.get("VAULT_FILE_PATH", "vault.enc")
+        kdf, _ = split_vault(Path(vault_path).read_bytes())
+        derived_key = derive_key_cached(vault_password, kdf=kdf).decode("ascii")
+        keyring.set_password(KEYRING_SERVICE, KEYRING_USERNAME, derived_key)
+        console.print("🔑 Vault key stored in the system keyring", style="green")
+    except (KeyringError, OSError) as e:
+        # The keys are already loaded; remembering them is only a convenience
+        console.print(f"⚠️  Could not store vault key: {e}", style="yellow")
+
+
 def load_from_vault() -> bool:
     """Load API keys from vault."""
     if not check_vault_exists():
@@ -44,8 +95,15 @@ def load_from_vault() -> bool:
         return False
     
     try:
-        vault_password = getpass.getpass("Enter vault password: ")
-        api_keys = get_api_keys(vault_password)
+        api_keys = load_keys_from_keyring()
+        if api_keys is not None:
+            console.print(
+                "🔑 Unlocked vault with the key from the system keyring", style="green"
+            )
+        else:
+            vault_password = getpass.getpass("Enter vault password: ")
+            api_keys = get_api_keys(vault_password)
+            remember_key_in_keyring(vault_password)
         
         # Set environment variables
         for key, value in api_keys.items():
@@ -124,7 +182,7 @@ def main():
     if len(env_keys) >= 1:
         console.print("\n✅ You already have API keys in your environment!", style="green")
         console.print("You can run workflows directly:", style="green")
-        console.print("  python scripts/run_workflow.py sequential_elaboration user_prompt='test'", style="cyan")
+        console.print("  python -m scripts.run_workflow sequential_elaboration user_prompt='test'", style="cyan")
         return
     
     console.print("\n🎯 Setup Options:")
@@ -165,7 +223,7 @@ def main():
     # Test the setup
     if len(check_env_keys()) > 0:
         console.print("\n🧪 Test your setup:", style="blue")
-        console.print("  python scripts/run_workflow.py sequential_elaboration user_prompt='Hello world'", style="cyan")
+        console.print("  python -m scripts.run_workflow sequential_elaboration user_prompt='Hello world'", style="cyan")
 
 
 if __name__ == "__main__":
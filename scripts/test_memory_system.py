@@ -2,14 +2,17 @@
 """
 Test script for Phase 4: Advanced Memory Management
 This script tests all components of the memory system integration.
+Usage: llmo-test-mem
+   or: python -m scripts.test_memory_system
 """
 
-import os
+import contextlib
 import sqlite3
 import sys
-
-# Add the app directory to the Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Optional
 
 from rich.console import Console
 from rich.panel import Panel
@@ -20,19 +23,82 @@ from app.memory_store import MemoryStore
 from app.workflow_engine import WorkflowEngine
 
 console = Console()
+_IS_TTY = sys.stdout.isatty()
+# Memory entries shown in the workflow test's contents table
+_PREVIEW_ROWS = 20
+
 
+def log(message: str, style: Optional[str] = None) -> None:
+    """Print a message through Rich on a terminal, or plainly when redirected."""
+    if _IS_TTY:
+        console.print(message, style=style)
+    else:
+        print(message)
+
+
+# Read connections shared by the checks below, one per database
+_connections: Dict[Path, sqlite3.Connection] = {}
+
+
+def _get_conn(db_path: Path) -> sqlite3.Connection:
+    """Return the shared read connection for a database, opening it once."""
+    # Opened in a worker thread by test_workflow_with_memory and reused by
+    # inspect_memory_database once that thread has finished
+    conn = _connections.get(db_path)
+    if conn is None:
+        conn = _connections[db_path] = sqlite3.connect(db_path, check_same_thread=False)
+    return conn
+
+
+def _close_conn(db_path: Path) -> None:
+    """Close the shared connection for a database, if one was ever opened."""
+    conn = _connections.pop(db_path, None)
+    if conn is not None:
+        conn.close()
+
+
+@contextlib.contextmanager
+def _temp_db_path():
+    """Yield a not-yet-created database path, removed along with its connection."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_path = Path(tmp_dir) / "memory.db"
+        try:
+            yield db_path
+        finally:
+            # Release the shared connection before the directory is removed
+            _close_conn(db_path)
+
+
+def _print_table(title: str, columns: list, rows: list) -> None:
+    """
+    Print rows under a title, as a Rich table on a terminal or plain text otherwise.
+
+    Args:
+        title: Table title
+        columns: (header, style) pairs
+        rows: Tuples of cell strings, one per row
+    """
+    if not _IS_TTY:
+        lines = [title, " | ".join(header for header, _ in columns)]
+        lines.extend(" | ".join(row) for row in rows)
+        print("\n".join(lines))
+        return
 
-def test_memory_store():
-    """Test the basic memory store functionality."""
-    console.print("\n🧪 Testing Memory Store...")
+    table = Table(title=title, show_lines=False)
+    for header, style in columns:
+        table.add_column(header, style=style)
+    for row in rows:
+        table.add_row(*row)
+    console.print(table)
 
-    # Use a test database
-    test_db = "test_memory.db"
-    if os.path.exists(test_db):
-        os.remove(test_db)
+
+def test_memory_store(db_path: str = ":memory:"):
+    """Test the basic memory store functionality against a fresh database."""
+    log("\n🧪 Testing Memory Store...")
 
     try:
-        store = MemoryStore(test_db)
+        # In-memory by default, so nothing touches the disk
+        store = MemoryStore(db_path)
 
         # Test adding entries
         workflow_id = "test_workflow_001"
@@ -54,78 +120,62 @@ def test_memory_store():
             metadata={"provider": "gemini", "model": "gemini-1.5-flash"},
         )
 
-        console.print(f"✅ Added entries: {entry_id1}, {entry_id2}")
+        log(f"✅ Added entries: {entry_id1}, {entry_id2}")
 
         # Test retrieval
         user_prompt = store.retrieve_user_prompt(workflow_id)
         step_output = store.retrieve_step_output(workflow_id, "initial_answer")
 
-        console.print(f"✅ Retrieved user prompt: {user_prompt[:50]}...")
-        console.print(f"✅ Retrieved step output: {step_output[:50]}...")
+        log(f"✅ Retrieved user prompt: {user_prompt[:50]}...")
+        log(f"✅ Retrieved step output: {step_output[:50]}...")
 
         # Test statistics
         stats = store.get_stats()
-        console.print(f"✅ Database stats: {stats}")
-
-        # Verify database file exists and has content
-        if os.path.exists(test_db):
-            console.print(f"✅ Database file created: {test_db}")
+        log(f"✅ Database stats: {stats}")
 
-            # Check table contents
-            with sqlite3.connect(test_db) as conn:
-                cursor = conn.cursor()
-                cursor.execute("SELECT COUNT(*) FROM memory_slices")
-                count = cursor.fetchone()[0]
-                console.print(f"✅ Database contains {count} entries")
+        # Verify the database has content
+        log(f"✅ Database contains {stats['total_entries']} entries")
 
         return True
 
     except Exception as e:
-        console.print(f"❌ Memory Store test failed: {e}", style="red")
+        log(f"❌ Memory Store test failed: {e}", style="red")
         return False
-    finally:
-        # Cleanup
-        if os.path.exists(test_db):
-            os.remove(test_db)
-
 
-def test_memory_manager():
-    """Test the memory manager functionality."""
-    console.print("\n🧪 Testing Memory Manager...")
 
-    # Use a test database
-    test_db = "test_memory_manager.db"
-    if os.path.exists(test_db):
-        os.remove(test_db)
+def test_memory_manager(db_path: str = ":memory:"):
+    """Test the memory manager functionality against a fresh database."""
+    log("\n🧪 Testing Memory Manager...")
 
     try:
-        manager = MemoryManager(db_path=test_db)
+        # In-memory by default, so nothing touches the disk
+        manager = MemoryManager(db_path=db_path)
 
         # Start a workflow
         workflow_id = manager.start_workflow(
             "test_workflow",
             {"user_prompt": "Explain machine learning", "model": "gpt-4"},
         )
-        console.print(f"✅ Started workflow: {workflow_id}")
+        log(f"✅ Started workflow: {workflow_id}")
 
-        # Save step results
+        # Save step results in a single transaction
         step1_result = {
             "output": "Machine learning is a subset of AI that enables computers to learn...",
             "provider": "openai",
             "model": "gpt-4",
             "simulated": False,
         }
-        manager.save_step_result("initial_analysis", step1_result)
-        console.print("✅ Saved step 1 result")
-
         step2_result = {
             "output": "Generate a more detailed explanation focusing on practical applications",
             "provider": "gemini",
             "model": "gemini-1.5-flash",
             "simulated": False,
         }
-        manager.save_step_result("elaboration_generator", step2_result)
-        console.print("✅ Saved step 2 result")
+        with manager.batch():
+            manager.save_step_result("initial_analysis", step1_result)
+            log("✅ Saved step 1 result")
+            manager.save_step_result("elaboration_generator", step2_result)
+            log("✅ Saved step 2 result")
 
         # Test context fetching
         step_config = {
@@ -138,7 +188,7 @@ def test_memory_manager():
         }
 
         context = manager.fetch_context_for_step(step_config)
-        console.print(f"✅ Fetched context: {list(context.keys())}")
+        log(f"✅ Fetched context: {list(context.keys())}")
 
         # Test memory injection
         original_inputs = {
@@ -146,36 +196,48 @@ def test_memory_manager():
         }
 
         injected_inputs = manager.inject_memory_context(original_inputs, context)
-        console.print("✅ Injected memory context")
-        console.print(f"   Original: {original_inputs['prompt'][:60]}...")
-        console.print(f"   Injected: {injected_inputs['prompt'][:60]}...")
+        expected_prompt = (
+            f"Based on {context['memory.user_prompt']}, "
+            f"elaborate on {context['memory.initial_analysis_output']}"
+        )
+        assert injected_inputs["prompt"] == expected_prompt, injected_inputs["prompt"]
+        log("✅ Injected memory context")
+        log(f"   Original: {original_inputs['prompt'][:60]}...")
+        log(f"   Injected: {injected_inputs['prompt'][:60]}...")
 
         # Test workflow summary
         summary = manager.get_workflow_summary()
-        console.print(f"✅ Workflow summary: {summary}")
+        log(f"✅ Workflow summary: {summary}")
 
         return True
 
     except Exception as e:
-        console.print(f"❌ Memory Manager test failed: {e}", style="red")
+        log(f"❌ Memory Manager test failed: {e}", style="red")
         return False
-    finally:
-        # Cleanup
-        if os.path.exists(test_db):
-            os.remove(test_db)
 
 
-def test_workflow_with_memory():
-    """Test the full workflow integration with memory."""
-    console.print("\n🧪 Testing Workflow with Memory Integration...")
+def test_workflow_with_memory(db_path: Optional[Path] = None):
+    """
+    Test the full workflow integration with memory.
 
-    # Clean up any existing memory.db
-    if os.path.exists("memory.db"):
-        os.remove("memory.db")
+    Args:
+        db_path: Memory database to create; must not exist yet, e.g. a path
+            inside a TemporaryDirectory owned by the caller. Defaults to a
+            throwaway temporary database.
+    """
+    if db_path is None:
+        with _temp_db_path() as tmp_db:
+            return test_workflow_with_memory(tmp_db)
+
+    log("\n🧪 Testing Workflow with Memory Integration...")
 
     try:
-        # Initialize workflow engine
+        # Initialize workflow engine, storing memory in db_path
         engine = WorkflowEngine()
+        # A scratch database, so trade durability for fewer fsyncs
+        engine.memory_manager = MemoryManager(
+            MemoryStore(str(db_path), fast_writes=True)
+        )
 
         # Run the sequential_elaboration workflow with memory
         result = engine.run(
@@ -185,99 +247,102 @@ def test_workflow_with_memory():
             },
         )
 
-        console.print("✅ Workflow completed successfully")
+        log("✅ Workflow completed successfully")
 
-        # Verify memory.db was created and contains data
-        if os.path.exists("memory.db"):
-            console.print("✅ Memory database created")
+        # Verify the memory database was created and contains data
+        if db_path.exists():
+            log("✅ Memory database created")
 
-            # Check database contents
-            with sqlite3.connect("memory.db") as conn:
-                cursor = conn.cursor()
-
-                # Get all entries
-                cursor.execute(
-                    """
-                    SELECT workflow_id, step_name, classification,
-                           substr(content, 1, 50) as content_preview
-                    FROM memory_slices
-                    ORDER BY timestamp
+            # Stream all entries, keeping only the first few for display
+            cursor = _get_conn(db_path).execute(
                 """
-                )
-
-                entries = cursor.fetchall()
-
-                # Create a table to display memory contents
-                table = Table(title="Memory Database Contents")
-                table.add_column("Workflow ID", style="cyan")
-                table.add_column("Step", style="green")
-                table.add_column("Type", style="yellow")
-                table.add_column("Content Preview", style="white")
-
-                for entry in entries:
-                    table.add_row(
-                        entry[0][-12:] + "...",  # Last 12 chars of workflow ID
-                        entry[1],
-                        entry[2],
-                        entry[3] + "..." if len(entry[3]) == 50 else entry[3],
+                SELECT workflow_id, step_name, classification,
+                       substr(content, 1, 50) as content_preview
+                FROM memory_slices
+                ORDER BY timestamp
+            """
+            )
+            rows = []
+            entry_count = 0
+            found_classifications = set()
+            for entry in cursor:
+                entry_count += 1
+                found_classifications.add(entry[2])
+                if len(rows) < _PREVIEW_ROWS:
+                    rows.append(
+                        (
+                            entry[0][-12:] + "...",  # Last 12 chars of workflow ID
+                            entry[1],
+                            entry[2],
+                            entry[3] + "..." if len(entry[3]) == 50 else entry[3],
+                        )
                     )
 
-                console.print(table)
-                console.print(f"✅ Found {len(entries)} memory entries")
+            # Display memory contents
+            _print_table(
+                "Memory Database Contents",
+                [
+                    ("Workflow ID", "cyan"),
+                    ("Step", "green"),
+                    ("Type", "yellow"),
+                    ("Content Preview", "white"),
+                ],
+                rows,
+            )
+            log(f"✅ Found {entry_count} memory entries")
 
-                # Verify we have the expected entries
-                expected_classifications = ["user_prompt", "parameters", "output"]
-                found_classifications = list(set([entry[2] for entry in entries]))
+            # Verify we have the expected entries
+            expected_classifications = ["user_prompt", "parameters", "output"]
 
-                for expected in expected_classifications:
-                    if expected in found_classifications:
-                        console.print(f"✅ Found {expected} entries")
-                    else:
-                        console.print(f"⚠️  Missing {expected} entries", style="yellow")
+            for expected in expected_classifications:
+                if expected in found_classifications:
+                    log(f"✅ Found {expected} entries")
+                else:
+                    log(f"⚠️  Missing {expected} entries", style="yellow")
 
         # Check if memory context was used in prompts
         if "elaboration_prompt_generator" in result:
             elaboration_step = result["elaboration_prompt_generator"]
             if isinstance(elaboration_step, dict) and "output" in elaboration_step:
-                console.print("✅ Memory-aware prompts were generated")
+                log("✅ Memory-aware prompts were generated")
 
         return True
 
     except Exception as e:
-        console.print(f"❌ Workflow with memory test failed: {e}", style="red")
+        log(f"❌ Workflow with memory test failed: {e}", style="red")
         return False
 
 
-def inspect_memory_database():
+def inspect_memory_database(db_path: Path):
     """Inspect the contents of the memory database after testing."""
-    console.print("\n🔍 Inspecting Memory Database Contents...")
+    log("\n🔍 Inspecting Memory Database Contents...")
 
-    if not os.path.exists("memory.db"):
-        console.print("❌ No memory.db file found", style="red")
+    if not db_path.exists():
+        log(f"❌ No {db_path} file found", style="red")
         return
 
     try:
-        store = MemoryStore("memory.db")
+        store = MemoryStore(str(db_path))
         stats = store.get_stats()
 
         # Display statistics
-        stats_table = Table(title="Memory Database Statistics")
-        stats_table.add_column("Metric", style="cyan")
-        stats_table.add_column("Value", style="green")
-
-        stats_table.add_row("Total Entries", str(stats["total_entries"]))
-        stats_table.add_row("Unique Workflows", str(stats["unique_workflows"]))
-        stats_table.add_row("Database Size", f"{stats['database_size_bytes']} bytes")
-
-        for classification, count in stats["by_classification"].items():
-            stats_table.add_row(f"  └─ {classification}", str(count))
-
-        console.print(stats_table)
+        rows = [
+            ("Total Entries", str(stats["total_entries"])),
+            ("Unique Workflows", str(stats["unique_workflows"])),
+            ("Database Size", f"{stats['database_size_bytes']} bytes"),
+        ]
+        rows.extend(
+            (f"  └─ {classification}", str(count))
+            for classification, count in stats["by_classification"].items()
+        )
+        _print_table(
+            "Memory Database Statistics", [("Metric", "cyan"), ("Value", "green")], rows
+        )
 
         # Show recent entries
-        with sqlite3.connect("memory.db") as conn:
-            cursor = conn.cursor()
-            cursor.execute(
+        recent_entries = (
+            _get_conn(db_path)
+            .execute(
                 """
                 SELECT workflow_id, step_name, classification,
                        substr(content, 1, 100) as content_preview,
@@ -287,16 +352,16 @@ def inspect_memory_database():
                 LIMIT 10
             """
             )
+            .fetchmany(10)
+        )
 
-            recent_entries = cursor.fetchall()
-
-            if recent_entries:
-                console.print("\n📋 Recent Memory Entries:")
-                for i, entry in enumerate(recent_entries, 1):
-                    console.print(f"{i}. [{entry[2]}] {entry[1]}: {entry[3]}...")
+        if recent_entries:
+            log("\n📋 Recent Memory Entries:")
+            for i, entry in enumerate(recent_entries, 1):
+                log(f"{i}. [{entry[2]}] {entry[1]}: {entry[3]}...")
 
     except Exception as e:
-        console.print(f"❌ Database inspection failed: {e}", style="red")
+        log(f"❌ Database inspection failed: {e}", style="red")
 
 
 def main():
@@ -308,35 +373,34 @@ def main():
         )
     )
 
-    results = []
-
-    # Test 1: Memory Store
-    results.append(test_memory_store())
-
-    # Test 2: Memory Manager
-    results.append(test_memory_manager())
-
-    # Test 3: Full Workflow Integration
-    results.append(test_workflow_with_memory())
+    with _temp_db_path() as workflow_db:
+        # The tests share no databases, so run them concurrently
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = [
+                executor.submit(test_memory_store),
+                executor.submit(test_memory_manager),
+                executor.submit(test_workflow_with_memory, workflow_db),
+            ]
+            results = [future.result() for future in futures]
 
-    # Inspect the memory database
-    inspect_memory_database()
+        # Inspect the memory database
+        inspect_memory_database(workflow_db)
 
     # Summary
-    console.print("\n📊 Test Results Summary:")
+    log("\n📊 Test Results Summary:")
     passed = sum(results)
     total = len(results)
 
     if passed == total:
-        console.print(f"🎉 All {total} tests passed!", style="bold green")
-        console.print("\n✅ Phase 4: Advanced Memory Management - COMPLETE!")
-        console.print("   ✓ Memory Store working correctly")
-        console.print("   ✓ Memory Manager functioning properly")
-        console.print("   ✓ Workflow integration successful")
-        console.print("   ✓ Memory database created and populated")
-        console.print("   ✓ Context-aware prompts generated")
+        log(f"🎉 All {total} tests passed!", style="bold green")
+        log("\n✅ Phase 4: Advanced Memory Management - COMPLETE!")
+        log("   ✓ Memory Store working correctly")
+        log("   ✓ Memory Manager functioning properly")
+        log("   ✓ Workflow integration successful")
+        log("   ✓ Memory database created and populated")
+        log("   ✓ Context-aware prompts generated")
     else:
-        console.print(f"❌ {passed}/{total} tests passed", style="red")
+        log(f"❌ {passed}/{total} tests passed", style="red")
 
     return passed == total
 
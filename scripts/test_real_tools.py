@@ -2,19 +2,19 @@
 """
 Test script to demonstrate Phase 3: Real Tools Integration.
 This script shows how the workflow engine now uses real tool implementations.
+Usage: python -m scripts.test_real_tools
 """
 
 import sys
-from pathlib import Path
 
 from rich.console import Console
 
-# Add the app directory to the path
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from app.workflow_engine import WorkflowEngine
 
-console = Console()
+# Markup stays on to strip the [bold] tags; highlighting and colour only
+# pay off on a terminal
+_IS_TTY = sys.stdout.isatty()
+console = Console(no_color=not _IS_TTY, highlight=_IS_TTY)
 
 
 def test_real_tools():
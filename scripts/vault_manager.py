@@ -1,18 +1,89 @@
-import glob
+import functools
 import os
-import platform
-import re
+import secrets
+import stat
+import sys
+import tempfile
+from pathlib import Path
+from typing import Optional
 
 import click
 from cryptography.fernet import Fernet, InvalidToken
 from rich.console import Console
 from rich.prompt import Prompt
-from rich.table import Table
 
-from app.key_management import PASSWORD_SALT, VAULT_FILE_PATH, derive_key
+from app.key_management import (
+    KDF_SCRYPT,
+    PASSWORD_SALT,
+    VAULT_FILE_PATH,
+    clear_derived_key_cache,
+    derive_key_cached,
+    encrypt_vault,
+    split_vault,
+)
 
 console = Console()
 
+_IS_WINDOWS = sys.platform.startswith("win")
+_EXPORT_LINE = "$env:{}='{}'\n" if _IS_WINDOWS else "export {}='{}'\n"
+
+
+@functools.lru_cache(maxsize=4)
+def _cipher_for_key(key: bytes) -> Fernet:
+    return Fernet(key)
+
+
+def _get_cipher(password: str, kdf: int = KDF_SCRYPT) -> Fernet:
+    """Return the vault cipher for a password, reusing keys derived this session."""
+    return _cipher_for_key(derive_key_cached(password, PASSWORD_SALT, kdf))
+
+
+# Ciphertext of the main vault and the (inode, mtime, size) it was read at;
+# the inode catches set_main_vault_flow renaming another vault into place
+_vault_cache: Optional[tuple[tuple[int, int, int], bytes]] = None
+
+
+def _read_vault() -> bytes:
+    """Return the main vault's ciphertext, re-reading only if the file changed."""
+    global _vault_cache
+    st = os.stat(VAULT_FILE_PATH)
+    stamp = (st.st_ino, st.st_mtime_ns, st.st_size)
+    if _vault_cache is None or _vault_cache[0] != stamp:
+        _vault_cache = (stamp, Path(VAULT_FILE_PATH).read_bytes())
+    return _vault_cache[1]
+
+
+def _invalidate_vault_cache() -> None:
+    global _vault_cache
+    _vault_cache = None
+
+
+def _write_vault(data: bytes) -> None:
+    """Replace the main vault atomically so a failed write never truncates it."""
+    vault_path = os.path.abspath(VAULT_FILE_PATH)
+    # mkstemp creates the file 0o600; keep the vault's own mode if it has one
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(vault_path), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            try:
+                os.fchmod(f.fileno(), stat.S_IMODE(os.stat(vault_path).st_mode))
+            except (AttributeError, FileNotFoundError):
+                pass  # No fchmod on Windows, or no vault yet
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, vault_path)
+    except BaseException:
+        Path(tmp_path).unlink(missing_ok=True)
+        raise
+    _invalidate_vault_cache()
+
+
+def _clear_cipher_cache() -> None:
+    """Forget all ciphers and derived keys, e.g. after the password changes."""
+    _cipher_for_key.cache_clear()
+    clear_derived_key_cache()
+
 
 def display_export_commands():
     """Securely decrypts the vault and writes the keys to a temporary script."""
@@ -24,38 +95,33 @@ def display_export_commands():
         return
 
     try:
-        with open(VAULT_FILE_PATH, "rb") as f:
-            encrypted_data = f.read()
+        kdf, token = split_vault(_read_vault())
 
         password = Prompt.ask(
             "Enter your master password to load the keys", password=True
         )
-        key = derive_key(password, PASSWORD_SALT)
-        cipher = Fernet(key)
+        cipher = _get_cipher(password, kdf)
 
         try:
-            decrypted_data = cipher.decrypt(encrypted_data).decode("utf-8")
+            decrypted_data = cipher.decrypt(token)
         except InvalidToken:
             console.print("[bold red]Invalid password. Cannot load keys.[/bold red]")
             return
 
-        is_windows = platform.system().lower() == "windows"
-        script_filename = "env_loader.ps1" if is_windows else ".env_loader.sh"
-
-        with open(script_filename, "w") as f:
-            if is_windows:
-                for line in decrypted_data.strip().split("\n"):
-                    if line:
-                        key, value = line.split("=", 1)
-                        f.write(f"$env:{key}='{value}'\n")
-            else:
-                f.write("#!/bin/bash\n")
-                for line in decrypted_data.strip().split("\n"):
-                    if line:
-                        key, value = line.split("=", 1)
-                        f.write(f"export {key}='{value}'\n")
-
-        if not is_windows:
+        script_filename = "env_loader.ps1" if _IS_WINDOWS else ".env_loader.sh"
+
+        pairs = (line.partition(b"=") for line in decrypted_data.splitlines())
+        script = "".join(
+            _EXPORT_LINE.format(key.decode("utf-8"), value.decode("utf-8"))
+            for key, sep, value in pairs
+            if sep
+        )
+        if not _IS_WINDOWS:
+            script = "#!/bin/bash\n" + script
+
+        Path(script_filename).write_text(script)
+
+        if not _IS_WINDOWS:
             os.chmod(script_filename, 0o700)
 
         console.print(
@@ -65,7 +131,7 @@ def display_export_commands():
             "\nTo load the keys into your current session, run the following command:"
         )
 
-        if is_windows:
+        if _IS_WINDOWS:
             console.print(f"\n    [bold cyan].\\{script_filename}[/bold cyan]\n")
         else:
             console.print(f"\n    [bold cyan]source ./{script_filename}[/bold cyan]\n")
@@ -73,7 +139,7 @@ def display_export_commands():
         console.print(
             "For security, [bold red]delete the script immediately after[/bold red] using it:"
         )
-        delete_command = "del" if is_windows else "rm"
+        delete_command = "del" if _IS_WINDOWS else "rm"
         console.print(
             f"\n    [bold cyan]{delete_command} {script_filename}[/bold cyan]\n"
         )
@@ -82,13 +148,27 @@ def display_export_commands():
         console.print(f"[bold red]An unexpected error occurred:[/bold red] {e}")
 
 
+def _is_side_vault(name: str) -> bool:
+    return name.startswith("side_vault") and name.endswith(".enc")
+
+
 def get_all_vaults():
-    """Finds all vault files in the current directory."""
-    return glob.glob("vault.enc") + glob.glob("side_vault*.enc")
+    """Finds all vault files in the current directory, main vault first."""
+    main_vaults, side_vaults = [], []
+    with os.scandir(".") as entries:
+        for entry in entries:
+            if entry.name == "vault.enc":
+                if entry.is_file():
+                    main_vaults.append(entry.name)
+            elif _is_side_vault(entry.name) and entry.is_file():
+                side_vaults.append(entry.name)
+    return main_vaults + side_vaults
 
 
 def view_vault_flow():
     """Interactive flow to view the contents of the main vault."""
+    from rich.table import Table
+
     console.print("\n[bold yellow]--- View Vault Contents ---[/bold yellow]")
     if not os.path.exists(VAULT_FILE_PATH):
         console.print(
@@ -97,17 +177,15 @@ def view_vault_flow():
         return
 
     try:
-        with open(VAULT_FILE_PATH, "rb") as f:
-            encrypted_data = f.read()
+        kdf, token = split_vault(_read_vault())
 
         password = Prompt.ask(
             "Enter your master password to view the vault", password=True
         )
-        key = derive_key(password, PASSWORD_SALT)
-        cipher = Fernet(key)
+        cipher = _get_cipher(password, kdf)
 
         try:
-            decrypted_data = cipher.decrypt(encrypted_data).decode("utf-8")
+            decrypted_data = cipher.decrypt(token)
         except InvalidToken:
             console.print("[bold red]Invalid password. Cannot view vault.[/bold red]")
             return
@@ -118,18 +196,18 @@ def view_vault_flow():
         table.add_column("API Key Name", style="cyan")
         table.add_column("Key Value (Redacted)", style="green")
 
-        lines = decrypted_data.strip().split("\n")
-        for line in lines:
-            match = re.match(r"^(?P<name>\w+)=(?P<value>.+)$", line)
-            if match:
-                key_name = match.group("name")
-                key_value = match.group("value")
-                redacted_value = (
-                    f"{key_value[:4]}...{key_value[-4:]}"
-                    if len(key_value) > 8
-                    else key_value
-                )
-                table.add_row(key_name, redacted_value)
+        for line in decrypted_data.splitlines():
+            key_name, sep, key_value = line.partition(b"=")
+            # Only NAME=value lines with a word-character name and a value
+            if not sep or not key_value or not key_name.replace(b"_", b"").isalnum():
+                continue
+            key_value = key_value.decode("utf-8")
+            redacted_value = (
+                f"{key_value[:4]}...{key_value[-4:]}"
+                if len(key_value) > 8
+                else key_value
+            )
+            table.add_row(key_name.decode("ascii"), redacted_value)
 
         console.print(table)
 
@@ -147,15 +225,13 @@ def change_password_flow():
         return
 
     try:
-        with open(VAULT_FILE_PATH, "rb") as f:
-            encrypted_data = f.read()
+        kdf, token = split_vault(_read_vault())
 
         old_password = Prompt.ask("Enter your CURRENT master password", password=True)
-        old_key = derive_key(old_password, PASSWORD_SALT)
-        cipher = Fernet(old_key)
+        cipher = _get_cipher(old_password, kdf)
 
         try:
-            decrypted_data = cipher.decrypt(encrypted_data)
+            decrypted_data = cipher.decrypt(token)
         except InvalidToken:
             console.print(
                 "[bold red]Invalid password. Password change failed.[/bold red]"
@@ -168,16 +244,19 @@ def change_password_flow():
             "Confirm your NEW master password", password=True
         )
 
-        if new_password != new_password_confirm:
+        if not secrets.compare_digest(
+            new_password.encode("utf-8"), new_password_confirm.encode("utf-8")
+        ):
             console.print("[bold red]New passwords do not match. Aborting.[/bold red]")
             return
 
-        new_key = derive_key(new_password, PASSWORD_SALT)
-        new_cipher = Fernet(new_key)
-        new_encrypted_data = new_cipher.encrypt(decrypted_data)
+        # Always re-key with scrypt, upgrading vaults written with PBKDF2
+        new_encrypted_data = encrypt_vault(
+            decrypted_data, derive_key_cached(new_password, PASSWORD_SALT)
+        )
 
-        with open(VAULT_FILE_PATH, "wb") as f:
-            f.write(new_encrypted_data)
+        _write_vault(new_encrypted_data)
+        _clear_cipher_cache()
 
         console.print("[bold green]Master password changed successfully![/bold green]")
 
@@ -222,6 +301,7 @@ def delete_vault_flow():
 
     try:
         os.remove(vault_to_delete)
+        _invalidate_vault_cache()
         console.print(
             f"Vault '[bold green]{vault_to_delete}[/bold green]' has been deleted."
         )
@@ -232,7 +312,7 @@ def delete_vault_flow():
 def set_main_vault_flow():
     """Interactive flow to set the main vault."""
     console.print("\n[bold yellow]--- Set Main Vault ---[/bold yellow]")
-    side_vaults = glob.glob("side_vault*.enc")
+    side_vaults = [vault for vault in get_all_vaults() if _is_side_vault(vault)]
 
     if not side_vaults:
         console.print("No side vaults found to promote.")
@@ -273,6 +353,7 @@ def set_main_vault_flow():
         )
 
     os.rename(vault_to_promote, "vault.enc")
+    _invalidate_vault_cache()
     console.print(
         f"Successfully set `[bold green]{vault_to_promote}[/bold green]` as the new main `vault.enc`."
     )
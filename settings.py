@@ -1,3 +1,4 @@
+import importlib
 import subprocess
 import sys
 
@@ -7,6 +8,12 @@ from rich.prompt import Prompt
 
 console = Console()
 
+# The click command each menu script exposes, for running it in-process
+SCRIPT_COMMANDS = {
+    "scripts.init_vault": "init_vault",
+    "scripts.vault_manager": "manage_vaults",
+}
+
 
 def run_script(script_name, args=None):
     """Runs a Python script as a module, with optional arguments."""
@@ -26,11 +33,40 @@ def run_script(script_name, args=None):
         )
 
 
+def run_in_process(script_name, args=None):
+    """Runs a script's click command in this interpreter, reusing loaded modules."""
+    module = importlib.import_module(script_name)
+    command = getattr(module, SCRIPT_COMMANDS[script_name])
+    try:
+        command.main(args=args or [], prog_name=script_name, standalone_mode=False)
+    except click.Abort:
+        console.print("\n[bold red]Aborted.[/bold red]")
+    except click.ClickException as e:
+        e.show()
+    except SystemExit as e:
+        if e.code not in (None, 0):
+            console.print(
+                f"\n[bold red]The script '{script_name}' exited with an error.[/bold red]"
+            )
+    except Exception as e:
+        # An isolated run would only have lost its own process, so keep the menu alive
+        console.print(
+            f"\n[bold red]The script '{script_name}' exited with an error.[/bold red]"
+        )
+        console.print(str(e), markup=False)
+
+
 @click.command()
-def settings():
+@click.option(
+    "--isolated",
+    is_flag=True,
+    help="Run each action in a separate Python process.",
+)
+def settings(isolated):
     """
     A master menu for managing project settings.
     """
+    run = run_script if isolated else run_in_process
     while True:
         console.print("\n[bold cyan]-- Project Settings --[/bold cyan]")
         console.print("[1] Initialize a new vault")
@@ -41,13 +77,13 @@ def settings():
         choice = Prompt.ask("Choose an option", default="q").lower()
 
         if choice == "1":
-            run_script("scripts.init_vault")
+            run("scripts.init_vault")
         elif choice == "2":
-            run_script("scripts.vault_manager")
+            run("scripts.vault_manager")
         elif choice == "3":
             # We can't truly export variables to the parent shell,
             # so we call a function within the vault manager to *display* the commands.
-            run_script("scripts.vault_manager", args=["display-keys"])
+            run("scripts.vault_manager", args=["display-keys"])
         elif choice == "q":
             console.print("Exiting settings.")
             break
@@ -5,9 +5,8 @@ import os
 import pytest
 import yaml
 from click.testing import CliRunner
-from cryptography.fernet import Fernet
 
-from app.key_management import PASSWORD_SALT, derive_key
+from app.key_management import PASSWORD_SALT, derive_key, encrypt_vault
 from app.main import cli
 
 
@@ -32,8 +31,7 @@ def mock_vault(tmp_path):
     password = "testpassword"
     keys = "GEMINI_API_KEY=fake_gemini_key\nANTHROPIC_API_KEY=fake_anthropic_key"
     encryption_key = derive_key(password, PASSWORD_SALT)
-    cipher = Fernet(encryption_key)
-    encrypted_data = cipher.encrypt(keys.encode("utf-8"))
+    encrypted_data = encrypt_vault(keys.encode("utf-8"), encryption_key)
     with open(vault_path, "wb") as f:
         f.write(encrypted_data)
     return vault_path, password
@@ -63,9 +61,12 @@ def mock_all_clients(monkeypatch):
 @pytest.fixture(autouse=True)
 def cleanup_conversations():
     yield
-    files = glob.glob("conversations/chat_*.json")
-    for f in files:
-        os.remove(f)
+    if not os.path.isdir("conversations"):
+        return
+    with os.scandir("conversations") as entries:
+        for entry in entries:
+            if entry.name.startswith("chat_") and entry.name.endswith(".json"):
+                os.unlink(entry.path)
 
 
 # --- Tests ---
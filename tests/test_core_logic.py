@@ -1,8 +1,15 @@
 import base64
 
 import pytest
-
-from app.key_management import PASSWORD_SALT, derive_key
+from cryptography.fernet import Fernet
+
+from app.key_management import (
+    KDF_PBKDF2,
+    PASSWORD_SALT,
+    derive_key,
+    encrypt_vault,
+    get_api_keys,
+)
 from app.main import parse_step
 from scripts.init_vault import parse_api_keys
 
@@ -33,6 +40,34 @@ def test_derive_key_is_valid_base64():
         pytest.fail("The derived key is not valid URL-safe Base64")
 
 
+def test_get_api_keys_reads_scrypt_vault(tmp_path, monkeypatch):
+    """Checks that a vault written with the default KDF decrypts."""
+    vault_path = tmp_path / "vault.enc"
+    key = derive_key("test_password", PASSWORD_SALT)
+    vault_path.write_bytes(encrypt_vault(b"GEMINI_API_KEY=key123", key))
+    monkeypatch.setenv("VAULT_FILE_PATH", str(vault_path))
+    assert get_api_keys("test_password") == {"GEMINI_API_KEY": "key123"}
+
+
+def test_get_api_keys_reads_legacy_pbkdf2_vault(tmp_path, monkeypatch):
+    """Checks that vaults written before scrypt support still decrypt."""
+    vault_path = tmp_path / "vault.enc"
+    key = derive_key("test_password", PASSWORD_SALT, KDF_PBKDF2)
+    vault_path.write_bytes(Fernet(key).encrypt(b"GEMINI_API_KEY=key123"))
+    monkeypatch.setenv("VAULT_FILE_PATH", str(vault_path))
+    assert get_api_keys("test_password") == {"GEMINI_API_KEY": "key123"}
+
+
+def test_get_api_keys_rejects_malformed_derived_key(tmp_path, monkeypatch):
+    """Checks that a malformed stored key fails like a wrong password."""
+    vault_path = tmp_path / "vault.enc"
+    key = derive_key("test_password", PASSWORD_SALT)
+    vault_path.write_bytes(encrypt_vault(b"GEMINI_API_KEY=key123", key))
+    monkeypatch.setenv("VAULT_FILE_PATH", str(vault_path))
+    with pytest.raises(ValueError, match="Invalid password"):
+        get_api_keys(derived_key=b"not-a-fernet-key")
+
+
 # --- Test Step Parser ---
 
 
@@ -77,6 +112,13 @@ def test_parse_api_keys_invalid_format():
         parse_api_keys(text_block)
 
 
+def test_parse_api_keys_unicode_whitespace():
+    """Tests that pasted non-ASCII whitespace around a line is ignored, not dropped."""
+    text_block = "GEMINI_API_KEY=key123\n\xa0ANTHROPIC_API_KEY=key456\u2003"
+    expected = {"GEMINI_API_KEY": "key123", "ANTHROPIC_API_KEY": "key456"}
+    assert parse_api_keys(text_block) == expected
+
+
 def test_parse_api_keys_empty_input():
     """Tests that the parser returns an empty dict for empty or whitespace-only input."""
     assert parse_api_keys("") == {}
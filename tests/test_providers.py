@@ -1,4 +1,8 @@
+import asyncio
+import os
+
 import pytest
+import pytest_asyncio
 
 from app.clients import get_client
 from app.key_management import get_api_keys
@@ -15,30 +19,13 @@ for provider, config in MODEL_CONFIG.items():
             ALL_MODELS.append((provider, model["name"]))
 
 
-@pytest.mark.parametrize("provider, model_name", ALL_MODELS)
-@pytest.mark.asyncio
-async def test_provider_model_generation(provider, model_name):
-    """
-    Test that each configured provider and model can generate text.
-    """
-    # This test requires a master password to be set as an environment variable
-    # for non-interactive testing.
-    import os
+def _api_key_name(provider):
+    return MODEL_CONFIG[provider].get("api_key_name")
 
-    password = os.environ.get("MASTER_PASSWORD")
-    if not password:
-        pytest.skip("MASTER_PASSWORD environment variable not set.")
 
-    api_keys = get_api_keys(password)
+async def _query_model(provider, model_name, api_key):
+    """Send a short prompt to one provider/model and return its response."""
     provider_config = MODEL_CONFIG.get(provider)
-    api_key_name = provider_config.get("api_key_name")
-    api_key = api_keys.get(api_key_name)
-
-    if not api_key:
-        pytest.fail(
-            f"API key '{api_key_name}' not found in vault for provider '{provider}'."
-        )
-
     model_details = next(
         (m for m in provider_config["models"] if m["name"] == model_name), None
     )
@@ -53,7 +40,60 @@ async def test_provider_model_generation(provider, model_name):
     )
 
     prompt = "hello"
-    response = await client.query(prompt)
+    return await client.query(prompt)
+
+
+@pytest.fixture(scope="session")
+def api_keys():
+    """Decrypt the vault once for the whole test session."""
+    # This test requires a master password to be set as an environment variable
+    # for non-interactive testing.
+    password = os.environ.get("MASTER_PASSWORD")
+    if not password:
+        pytest.skip("MASTER_PASSWORD environment variable not set.")
+    return get_api_keys(password)
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def provider_responses(api_keys):
+    """
+    Query every configured provider and model concurrently, once per session.
+
+    Maps each (provider, model_name) pair that has an API key to its response,
+    or to the exception (including pytest failures) raised while querying it.
+    """
+    queried = [
+        (provider, model_name)
+        for provider, model_name in ALL_MODELS
+        if api_keys.get(_api_key_name(provider))
+    ]
+    results = await asyncio.gather(
+        *(
+            _query_model(provider, model_name, api_keys[_api_key_name(provider)])
+            for provider, model_name in queried
+        ),
+        return_exceptions=True,
+    )
+    return dict(zip(queried, results, strict=True))
+
+
+@pytest.mark.parametrize("provider, model_name", ALL_MODELS)
+@pytest.mark.asyncio(loop_scope="session")
+async def test_provider_model_generation(
+    provider, model_name, api_keys, provider_responses
+):
+    """
+    Test that each configured provider and model can generate text.
+    """
+    api_key_name = _api_key_name(provider)
+    if not api_keys.get(api_key_name):
+        pytest.fail(
+            f"API key '{api_key_name}' not found in vault for provider '{provider}'."
+        )
+
+    response = provider_responses[(provider, model_name)]
+    if isinstance(response, BaseException):
+        raise response
 
     assert isinstance(response, str)
     assert len(response) > 0
@@ -0,0 +1,282 @@
+import pytest
+
+from app.executor import WorkflowExecutor
+from app.workflow_engine import WorkflowEngine
+from app.workflow_models import StepDC, WorkflowDC
+
+WORKFLOWS_YAML = """
+workflows:
+  cached:
+    cacheable: true
+    params:
+      - topic
+    steps:
+      - name: answer
+        tool: model_call
+        inputs:
+          prompt: "{{params.topic}}"
+  flaky:
+    cacheable: true
+    params:
+      - topic
+    steps:
+      - name: answer
+        tool: flaky
+        on_failure: continue
+        inputs:
+          prompt: "{{params.topic}}"
+  uncached:
+    params:
+      - topic
+    steps:
+      - name: answer
+        tool: model_call
+        inputs:
+          prompt: "{{params.topic}}"
+"""
+
+# --- Fake Tools ---
+
+
+class DraftTool:
+    """Returns whatever reply the test sets, standing in for an LLM call."""
+
+    def __init__(self):
+        self.reply = "first draft"
+
+    def execute(self, **inputs):
+        return {"output": self.reply}
+
+
+class SummarizeTool:
+    """Records each call so tests can tell cache hits from misses."""
+
+    def __init__(self):
+        self.calls = []
+
+    def execute(self, **inputs):
+        self.calls.append(inputs)
+        return {"output": f"{inputs['style']} summary of {inputs['text']}"}
+
+
+class FlakyTool:
+    """Fails or falls back to a simulated error first, then succeeds."""
+
+    def __init__(self, first_failure):
+        self.first_failure = first_failure
+        self.calls = 0
+
+    def execute(self, **inputs):
+        self.calls += 1
+        if self.calls == 1:
+            if isinstance(self.first_failure, Exception):
+                raise self.first_failure
+            return self.first_failure
+        return {"output": f"answer to {inputs['prompt']}"}
+
+
+class StubExecutor:
+    """Stands in for WorkflowExecutor, numbering each real run."""
+
+    def __init__(self):
+        self.runs = 0
+        self.last_run_complete = True
+
+    def execute_workflow(self, workflow_name, workflow, params):
+        self.runs += 1
+        return {"answer": {"output": f"run {self.runs} of {params['topic']}"}}
+
+
+# --- Fixtures ---
+
+
+@pytest.fixture
+def executor():
+    executor = WorkflowExecutor()
+    executor.tools = {"draft": DraftTool(), "summarize": SummarizeTool()}
+    return executor
+
+
+@pytest.fixture
+def workflow():
+    return WorkflowDC(
+        params=["topic", "style"],
+        steps=[
+            StepDC(name="draft", tool="draft", inputs={"topic": "{{params.topic}}"}),
+            StepDC(
+                name="summary",
+                tool="summarize",
+                inputs={
+                    "text": "{{steps.draft.output}}",
+                    "style": "{{params.style}}",
+                },
+                cache=True,
+            ),
+        ],
+    )
+
+
+@pytest.fixture
+def engine(tmp_path, monkeypatch):
+    monkeypatch.setenv("LLM_ORCH_NOCACHE", "1")
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text(WORKFLOWS_YAML)
+    engine = WorkflowEngine(config_path=str(config_path))
+    engine.executor = StubExecutor()
+    return engine
+
+
+PARAMS = {"topic": "caching", "style": "short"}
+
+
+# --- Step Cache Tests ---
+
+
+def test_cached_step_reuses_result(executor, workflow):
+    """A `cache: true` step with identical resolved inputs runs only once."""
+    first = executor.execute_workflow("wf", workflow, PARAMS)
+    second = executor.execute_workflow("wf", workflow, PARAMS)
+
+    assert len(executor.tools["summarize"].calls) == 1
+    assert second["summary"] == first["summary"]
+
+
+def test_cached_step_misses_on_param_change(executor, workflow):
+    """Changing a parameter the step uses produces a new cache key."""
+    executor.execute_workflow("wf", workflow, PARAMS)
+    executor.execute_workflow("wf", workflow, {**PARAMS, "style": "long"})
+
+    assert len(executor.tools["summarize"].calls) == 2
+
+
+def test_cached_step_misses_on_upstream_change(executor, workflow):
+    """A different upstream step output produces a new cache key."""
+    executor.execute_workflow("wf", workflow, PARAMS)
+    executor.tools["draft"].reply = "second draft"
+    result = executor.execute_workflow("wf", workflow, PARAMS)
+
+    assert len(executor.tools["summarize"].calls) == 2
+    assert result["summary"]["output"] == "short summary of second draft"
+
+
+def test_cached_step_result_is_a_copy(executor, workflow):
+    """Mutating a returned step output does not alter later cache hits."""
+    first = executor.execute_workflow("wf", workflow, PARAMS)
+    first["summary"]["output"] = "mutated"
+
+    second = executor.execute_workflow("wf", workflow, PARAMS)
+    second["summary"]["output"] += " again"
+
+    third = executor.execute_workflow("wf", workflow, PARAMS)
+    assert third["summary"]["output"] == "short summary of first draft"
+
+
+# --- Workflow Cache Tests ---
+
+
+def test_cacheable_workflow_reuses_result(engine):
+    """A cacheable workflow run again with the same params is not re-executed."""
+    first = engine.run("cached", {"topic": "a"})
+    second = engine.run("cached", {"topic": "a"})
+
+    assert engine.executor.runs == 1
+    assert second == first
+
+
+def test_cacheable_workflow_misses_on_param_change(engine):
+    """Different params run the workflow again."""
+    engine.run("cached", {"topic": "a"})
+    result = engine.run("cached", {"topic": "b"})
+
+    assert engine.executor.runs == 2
+    assert result["answer"]["output"] == "run 2 of b"
+
+
+def test_workflow_without_cacheable_always_runs(engine):
+    """Workflows are only memoized when marked `cacheable: true`."""
+    engine.run("uncached", {"topic": "a"})
+    engine.run("uncached", {"topic": "a"})
+
+    assert engine.executor.runs == 2
+
+
+def test_reload_config_invalidates_workflow_cache(engine):
+    """Reloading the configuration drops results cached under the old one."""
+    engine.run("cached", {"topic": "a"})
+    engine.reload_config()
+    result = engine.run("cached", {"topic": "a"})
+
+    assert engine.executor.runs == 2
+    assert result["answer"]["output"] == "run 2 of a"
+
+
+def test_cached_workflow_result_is_a_copy(engine):
+    """Mutating a returned result does not alter later cache hits."""
+    first = engine.run("cached", {"topic": "a"})
+    first["answer"]["output"] = "mutated"
+
+    second = engine.run("cached", {"topic": "a"})
+    assert second["answer"]["output"] == "run 1 of a"
+
+
+@pytest.mark.parametrize(
+    "first_failure",
+    [
+        RuntimeError("transient"),
+        {"simulated": True, "error": "no API key", "output": "[simulated]"},
+    ],
+    ids=["continue-after-exception", "simulated-fallback"],
+)
+def test_failed_step_run_is_not_cached(engine, first_failure):
+    """A run whose step failed under `on_failure: continue` is retried."""
+    flaky = FlakyTool(first_failure)
+    engine.executor = WorkflowExecutor()
+    engine.executor.tools = {"flaky": flaky}
+
+    first = engine.run("flaky", {"topic": "a"})
+    second = engine.run("flaky", {"topic": "a"})
+    third = engine.run("flaky", {"topic": "a"})
+
+    assert "error" in first["answer"]
+    assert second == {"answer": {"output": "answer to a"}}
+    assert third == second
+    assert flaky.calls == 2
+
+
+def test_gate_rejected_run_is_incomplete(executor, workflow, monkeypatch):
+    """A run stopped at a rejected gate is not reported as complete."""
+    gated = WorkflowDC(
+        params=workflow.params,
+        steps=[
+            StepDC(name="approve", tool="gate", inputs={}, gate={"prompt": "Go?"}),
+            *workflow.steps,
+        ],
+    )
+    monkeypatch.setattr(executor, "_handle_scrutiny_gate", lambda step: False)
+
+    result = executor.execute_workflow("wf", gated, PARAMS)
+
+    assert result == {}
+    assert executor.last_run_complete is False
+
+
+def test_gated_workflow_cannot_be_cacheable(tmp_path, monkeypatch):
+    """A cache hit would skip the approval, so the config is rejected."""
+    monkeypatch.setenv("LLM_ORCH_NOCACHE", "1")
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text(
+        """
+workflows:
+  gated:
+    cacheable: true
+    params: []
+    steps:
+      - name: approve
+        tool: gate
+        inputs: {}
+        gate:
+          prompt: "Go?"
+"""
+    )
+    with pytest.raises(SystemExit):
+        WorkflowEngine(config_path=str(config_path))